@@ -14,12 +14,25 @@ Usage:
 """
 
 import logging
-import time
-from typing import Optional
+from typing import Optional, Tuple
 
 from playwright.sync_api import Page, Browser, TimeoutError
 
 
+# Listed in priority order; the comma-joined union only answers "is any present?"
+_ACCEPT_BUTTON_SELECTORS = (
+    'button:has-text("Accept all")',
+    'button:has-text("I agree")',
+    'button:has-text("Accept")',
+    'button:has-text("Agree")',
+)
+_ACCEPT_ARIA_SELECTORS = (
+    '[aria-label*="Accept"]',
+    '[aria-label*="Agree"]',
+    '[aria-label*="consent"]',
+)
+
+
 class GoogleConsentHandler:
     """
     Handles Google consent/privacy pages that appear before accessing Google services.
@@ -106,20 +119,26 @@ class GoogleConsentHandler:
             try:
                 if strategy(page):
                     self.logger.debug(f"Consent strategy {strategy.__name__} executed")
-                    page.wait_for_timeout(2000)
-                    if not self._is_consent_page(page):
+                    if self._wait_until_off_consent(page, 2000):
                         return True
             except Exception as e:
                 self.logger.debug(f"Consent strategy {strategy.__name__} failed: {e}")
 
         # Final check in case the locator handler succeeded asynchronously
-        page.wait_for_timeout(1000)
-        if not self._is_consent_page(page):
+        if self._wait_until_off_consent(page, 1000):
             self.logger.debug("Consent cleared by asynchronous handler")
             return True
 
         return False
 
+    def _wait_until_off_consent(self, page: Page, timeout: int) -> bool:
+        """Return as soon as the page leaves the consent host, or False after ``timeout`` ms."""
+        try:
+            page.wait_for_url(lambda url: "consent.google.com" not in url, timeout=timeout, wait_until="commit")
+            return True
+        except TimeoutError:
+            return False
+
     def _click_accept_all(self, page: Page):
         """Click the Accept all button when consent dialog appears."""
         target_url_before = page.url
@@ -135,14 +154,10 @@ class GoogleConsentHandler:
             except Exception as e2:
                 self.logger.warning(f"Could not automatically accept consent via handler: {e2}")
 
-        # Allow navigation to proceed asynchronously
-        page.wait_for_timeout(1000)
-
         # Wait for redirect to complete
         try:
             page.wait_for_url(lambda url: "consent.google.com" not in url, timeout=self.timeout)
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(1000)
+            page.wait_for_load_state("domcontentloaded")
         except TimeoutError:
             self.logger.warning("Timeout waiting for consent redirect")
 
@@ -151,43 +166,29 @@ class GoogleConsentHandler:
 
     def _try_click_selector(self, page: Page) -> bool:
         """Try clicking accept button using CSS selectors."""
-        selectors = [
-            'button:has-text("Accept all")',
-            'button:has-text("I agree")',
-            'button:has-text("Accept")',
-            'button:has-text("Agree")',
-        ]
-
-        for selector in selectors:
-            try:
-                button = page.locator(selector).first
-                if button.is_visible(timeout=self.timeout):
-                    button.click()
-                    self.logger.debug(f"Clicked accept button with selector: {selector}")
-                    return True
-            except:
-                continue
-
-        return False
+        return self._click_first_visible(page, _ACCEPT_BUTTON_SELECTORS, "selector")
 
     def _try_click_aria_label(self, page: Page) -> bool:
         """Try clicking accept button using ARIA labels."""
-        aria_patterns = [
-            '[aria-label*="Accept"]',
-            '[aria-label*="Agree"]',
-            '[aria-label*="consent"]',
-        ]
+        return self._click_first_visible(page, _ACCEPT_ARIA_SELECTORS, "aria-label")
 
-        for pattern in aria_patterns:
-            try:
-                button = page.locator(pattern).first
-                if button.is_visible(timeout=self.timeout):
+    def _click_first_visible(self, page: Page, selectors: Tuple[str, ...], strategy: str) -> bool:
+        """Click the highest-priority visible match, after one union query rules out a miss.
+
+        ``.first`` on the union would pick the earliest match in DOM order, so a
+        generic aria-label node could beat the real "Accept all" button.
+        """
+        try:
+            if page.locator(", ".join(selectors)).count() == 0:
+                return False
+            for selector in selectors:
+                button = page.locator(selector).first
+                if button.is_visible():
                     button.click()
-                    self.logger.debug(f"Clicked accept button with aria-label: {pattern}")
+                    self.logger.debug(f"Clicked accept button with {strategy}: {selector}")
                     return True
-            except:
-                continue
-
+        except Exception as e:
+            self.logger.debug(f"Accept button {strategy} click failed: {e}")
         return False
 
     def _try_javascript_click(self, page: Page) -> bool:
@@ -242,14 +243,7 @@ class GoogleConsentHandler:
         Returns:
             True if consent was completed, False if still on consent page
         """
-        start_time = time.time() * 1000
-
-        while (time.time() * 1000) - start_time < max_wait:
-            if not self._is_consent_page(page):
-                return True
-            page.wait_for_timeout(500)
-
-        return False
+        return self._wait_until_off_consent(page, max_wait)
 
 
 # Convenience function for quick usage
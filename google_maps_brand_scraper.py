@@ -19,16 +19,47 @@ Usage:
 import logging
 import os
 import re
+import string
 import time
 import json
 import base64
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from playwright.sync_api import sync_playwright, Browser, TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+import pw_patch
 from google_maps_session_manager import GoogleMapsSessionManager
-from proxy_manager import create_default_proxy_manager, ProxyManager
+from proxy_manager import ProxyManager, create_default_proxy_manager
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+__all__ = [
+    "CARD_SELECTOR_PRIORITIES",
+    "CTA_EXCLUSION_NAMES",
+    "DIRECTORY_CONTAINER_SELECTORS",
+    "DIRECTORY_READY_SELECTOR",
+    "DIRECTORY_TAB_SELECTORS",
+    "VIEW_ALL_LOCATOR_PRIORITIES",
+    "GoogleMapsBrandScraper",
+    "PbDirectoryCollector",
+    "ScrollTelemetry",
+    "activate_directory_tab",
+    "extract_brands_from_page",
+    "filter_cards",
+    "get_directory_cards",
+    "main",
+    "parse_directory_cards",
+    "scroll_directory_until_complete",
+]
+
+
+# Opt-in: PW_INSPECT_STACK=0 drops Playwright's per-call stack capture
+pw_patch.apply_from_env()
 
 
 VIEW_ALL_LOCATOR_PRIORITIES: Sequence[str] = (
@@ -60,6 +91,42 @@ DIRECTORY_CONTAINER_SELECTORS: Sequence[str] = (
     'div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde',
 )
 
+# lxml's C parser builds the directory soup several times faster when installed
+try:
+    BeautifulSoup("", "lxml")
+    _HTML_PARSER = "lxml"
+except FeatureNotFound:  # pragma: no cover - optional dependency
+    _HTML_PARSER = "html.parser"
+
+# Returns {selector, html} for the first selector that matches, or null
+_DIRECTORY_HTML_SCRIPT = """
+(selectors) => {
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (el) return { selector, html: el.outerHTML };
+    }
+    return null;
+}
+"""
+
+# Height and card count of the scroll container in a single round-trip
+_SCROLL_METRICS_SCRIPT = "el => [el.scrollHeight, el.children.length]"
+
+# A pb= response lands before its cards render; wait (up to ``ms``) for the list
+# to grow past ``n`` children before sampling, so the sample is not stale
+_SCROLL_METRICS_AFTER_GROWTH_SCRIPT = """(el, [n, ms]) => new Promise(resolve => {
+    const metrics = () => [el.scrollHeight, el.children.length];
+    if (el.children.length > n) return resolve(metrics());
+    const observer = new MutationObserver(() => {
+        if (el.children.length > n) { observer.disconnect(); resolve(metrics()); }
+    });
+    observer.observe(el, { childList: true });
+    setTimeout(() => { observer.disconnect(); resolve(metrics()); }, ms);
+})"""
+
+# Any directory container becoming visible means the Maps UI is usable
+DIRECTORY_READY_SELECTOR = ", ".join(DIRECTORY_CONTAINER_SELECTORS)
+
 DIRECTORY_TAB_SELECTORS: Sequence[str] = (
     '#directory-tab',
     '[aria-label^="Directory"]',
@@ -67,6 +134,9 @@ DIRECTORY_TAB_SELECTORS: Sequence[str] = (
     'div[role="tab"]:has-text("Directory")',
 )
 
+_LABEL_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_LABEL_SAFE_CHARS_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
 CTA_EXCLUSION_NAMES = {
     "order online",
     "reserve a table",
@@ -88,67 +158,29 @@ def activate_directory_tab(
 
     logger.info(f"[DIRECTORY_TAB] Starting activation with {len(selectors)} selectors")
 
+    # The browser resolves whichever alternative matches in one polling loop
+    combined = ", ".join(selectors)
+
     for attempt in range(1, max_attempts + 1):
         logger.debug(f"[DIRECTORY_TAB] Attempt {attempt}/{max_attempts}")
-        for selector in selectors:
-            logger.debug(f"[DIRECTORY_TAB] Trying selector: {selector}")
-            try:
-                locator = page.locator(selector)
-                count = locator.count()
-                logger.debug(f"[DIRECTORY_TAB] Selector {selector} found {count} elements")
-
-                if count == 0:
-                    continue
-
-                candidate = getattr(locator, "first", locator)
-                if callable(candidate):
-                    candidate = candidate()
-
-                if hasattr(candidate, "is_enabled"):
-                    try:
-                        enabled = candidate.is_enabled()
-                        logger.debug(f"[DIRECTORY_TAB] Selector {selector} enabled: {enabled}")
-                        if not enabled:
-                            continue
-                    except Exception as e:
-                        logger.debug(f"[DIRECTORY_TAB] Selector {selector} enabled check failed: {e}")
-                        continue
-
-                scroll_heading = getattr(candidate, "scroll_into_view_if_needed", None)
-                if callable(scroll_heading):
-                    try:
-                        scroll_heading(timeout=wait_between_attempts_ms)
-                    except Exception as e:
-                        logger.debug(f"[DIRECTORY_TAB] Selector {selector} scroll failed: {e}")
-
-                if not hasattr(candidate, "is_visible"):
-                    logger.debug(f"[DIRECTORY_TAB] Selector {selector} has no is_visible method")
-                    continue
-
-                try:
-                    visible = candidate.is_visible(timeout=wait_between_attempts_ms)
-                    logger.debug(f"[DIRECTORY_TAB] Selector {selector} visible: {visible}")
-                    if not visible:
-                        continue
-                except PlaywrightTimeoutError:
-                    logger.debug(f"[DIRECTORY_TAB] Selector {selector} visibility timeout")
-                    continue
+        try:
+            candidate = page.locator(combined).first
+            candidate.wait_for(state="visible", timeout=wait_between_attempts_ms)
 
-                logger.info(f"[DIRECTORY_TAB] Clicking selector: {selector}")
-                candidate.click()
+            if not candidate.is_enabled():
+                logger.debug("[DIRECTORY_TAB] Directory tab is disabled")
                 page.wait_for_timeout(wait_between_attempts_ms)
-                logger.info("Activated directory tab via selector %s", selector)
-                return True
-            except Exception as exc:
-                logger.debug(
-                    "Directory tab selector %s failed on attempt %s: %s",
-                    selector,
-                    attempt,
-                    exc,
-                )
                 continue
 
-        page.wait_for_timeout(wait_between_attempts_ms)
+            candidate.scroll_into_view_if_needed(timeout=wait_between_attempts_ms)
+            candidate.click()
+            page.wait_for_timeout(wait_between_attempts_ms)
+            logger.info("Activated directory tab via selectors %s", combined)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug("[DIRECTORY_TAB] No directory tab visible on attempt %s", attempt)
+        except Exception as exc:
+            logger.debug("Directory tab activation failed on attempt %s: %s", attempt, exc)
 
     return False
 
@@ -345,6 +377,25 @@ def _load_pb_payloads_from_har(context, *, logger=None) -> List[Dict[str, Option
         return None
 
 
+def _wait_for_directory(page, *, timeout_ms: int = 5000, logger=None) -> bool:
+    """Wait until a directory container is visible instead of sleeping a fixed time."""
+
+    logger = logger or logging.getLogger(__name__)
+    wait_for_selector = getattr(page, "wait_for_selector", None)
+    if not callable(wait_for_selector):
+        # Short grace period for pages that cannot wait on a selector
+        page.wait_for_timeout(500)
+        return False
+    try:
+        wait_for_selector(DIRECTORY_READY_SELECTOR, state="visible", timeout=timeout_ms)
+        return True
+    except PlaywrightTimeoutError:
+        logger.debug("Directory not visible within %sms", timeout_ms)
+    except Exception as exc:
+        logger.debug("Directory wait failed: %s", exc)
+    return False
+
+
 def _click_view_all_button(
     page,
     *,
@@ -358,18 +409,57 @@ def _click_view_all_button(
     logger = logger or logging.getLogger(__name__)
     logger.info("Looking for View all button...")
 
+    # Locators are lazy, so resolve each selector once and re-query them per attempt
+    candidates = []
+    for selector in selectors:
+        try:
+            if selector.startswith("ROLE::"):
+                _, role, name = selector.split("::", 2)
+                locator = page.get_by_role(role, name=name)
+            else:
+                locator = page.locator(selector)
+        except Exception as exc:
+            logger.debug("View all selector %s could not be resolved: %s", selector, exc)
+            continue
+
+        candidate = getattr(locator, "first", locator)
+        if callable(candidate):
+            candidate = candidate()
+        candidates.append((selector, candidate))
+
+    # One union query tells us whether any candidate exists before probing them in priority order
+    union = None
+    for _, candidate in candidates:
+        combine = getattr(union, "or_", None)
+        if union is None:
+            union = candidate
+        elif callable(combine):
+            union = combine(candidate)
+        else:
+            union = None
+            break
+
     for attempt in range(1, max_attempts + 1):
-        for selector in selectors:
+        if union is not None and len(candidates) > 1:
             try:
-                if selector.startswith("ROLE::"):
-                    _, role, name = selector.split("::", 2)
-                    locator = page.get_by_role(role, name=name)
-                else:
-                    locator = page.locator(selector)
+                if union.count() == 0:
+                    page.wait_for_timeout(retry_interval_ms)
+                    continue
+            except Exception as exc:
+                logger.debug("View all union probe failed on attempt %s: %s", attempt, exc)
 
-                candidate = getattr(locator, "first", locator)
-                if callable(candidate):
-                    candidate = candidate()
+        for selector, candidate in candidates:
+            try:
+                # Visibility first: a hidden candidate needs no enabled/scroll round-trips
+                is_visible = getattr(candidate, "is_visible", None)
+                if callable(is_visible):
+                    try:
+                        if not is_visible(timeout=retry_interval_ms):
+                            continue
+                    except PlaywrightTimeoutError:
+                        continue
+                    except Exception:
+                        continue
 
                 is_enabled = getattr(candidate, "is_enabled", None)
                 if callable(is_enabled):
@@ -386,23 +476,13 @@ def _click_view_all_button(
                     except Exception as exc:
                         logger.debug("Scroll into view failed for selector %s: %s", selector, exc)
 
-                is_visible = getattr(candidate, "is_visible", None)
-                if callable(is_visible):
-                    try:
-                        if not is_visible(timeout=retry_interval_ms):
-                            continue
-                    except PlaywrightTimeoutError:
-                        continue
-                    except Exception:
-                        continue
-
                 try:
                     candidate.click()
                 except Exception as exc:
                     logger.debug("Click via selector %s failed: %s", selector, exc)
                     continue
 
-                page.wait_for_timeout(1500)
+                _wait_for_directory(page, logger=logger)
                 logger.info("Clicked View all using selector %s", selector)
                 return True
             except Exception as exc:
@@ -452,7 +532,7 @@ def _click_view_all_button(
         if fallback_candidate is not None:
             try:
                 fallback_candidate.click()
-                page.wait_for_timeout(1500)
+                _wait_for_directory(page, logger=logger)
                 logger.info("Clicked View all using section fallback")
                 return True
             except Exception as exc:
@@ -588,44 +668,22 @@ def get_directory_cards(page, *, logger=None) -> List[Dict[str, Optional[str]]]:
 
     logger = logger or logging.getLogger(__name__)
 
-    container_handle = None
-    for selector in DIRECTORY_CONTAINER_SELECTORS:
-        logger.info("Trying directory container selector: %s", selector)
-        try:
-            candidate = page.locator(selector)
-            count = candidate.count()
-            logger.info("Selector %s found %d elements", selector, count)
-
-            if count == 0:
-                continue
-
-            wait_for = getattr(candidate, "wait_for", None)
-            if callable(wait_for):
-                try:
-                    wait_for(state="attached", timeout=1500)
-                    logger.info("Selector %s is attached", selector)
-                except PlaywrightTimeoutError:
-                    logger.info("Selector %s attachment timeout", selector)
-                    continue
-
-            candidate.evaluate("el => el")
-            container_handle = candidate
-            logger.info("Using directory container selector: %s", selector)
-            break
-        except PlaywrightTimeoutError:
-            logger.info("Selector %s timeout", selector)
-            continue
-        except Exception as e:
-            logger.info("Selector %s failed: %s", selector, e)
-            continue
+    # One in-page lookup walks the selectors in priority order and returns the
+    # first container's markup, instead of count/wait/evaluate per selector
+    match = None
+    try:
+        match = page.evaluate(_DIRECTORY_HTML_SCRIPT, list(DIRECTORY_CONTAINER_SELECTORS))
+    except Exception as e:
+        logger.info("Directory container lookup failed: %s", e)
 
-    if container_handle is None:
+    if not match:
         logger.warning("Directory container not found with known selectors; falling back to full page content")
         html = page.content()
     else:
-        html = container_handle.evaluate("el => el.outerHTML")
+        logger.info("Using directory container selector: %s", match["selector"])
+        html = match["html"]
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _HTML_PARSER)
     return parse_directory_cards(soup)
 
 
@@ -743,8 +801,7 @@ def scroll_directory_until_complete(
     telemetry = ScrollTelemetry(0, 0, False, 0)
 
     try:
-        last_child_count = container.evaluate("el => el.children.length")
-        last_scroll_height = container.evaluate("el => el.scrollHeight")
+        last_scroll_height, last_child_count = container.evaluate(_SCROLL_METRICS_SCRIPT)
         empty_scrolls = 0
         idle_scrolls = 0
         total_scrolls = 0
@@ -761,10 +818,21 @@ def scroll_directory_until_complete(
                 )
 
             total_scrolls += 1
-            page.wait_for_timeout(wait_between_scrolls_ms)
-
-            current_child_count = container.evaluate("el => el.children.length")
-            current_height = container.evaluate("el => el.scrollHeight")
+            # Wake as soon as the next pb= batch lands instead of sleeping the full interval
+            wait_started = time.monotonic()
+            try:
+                page.wait_for_event(
+                    "response",
+                    predicate=lambda response: "pb=" in getattr(response, "url", ""),
+                    timeout=wait_between_scrolls_ms,
+                )
+            except PlaywrightTimeoutError:
+                current_height, current_child_count = container.evaluate(_SCROLL_METRICS_SCRIPT)
+            else:
+                remaining_ms = max(0, wait_between_scrolls_ms - int((time.monotonic() - wait_started) * 1000))
+                current_height, current_child_count = container.evaluate(
+                    _SCROLL_METRICS_AFTER_GROWTH_SCRIPT, [last_child_count, remaining_ms]
+                )
 
             if current_child_count <= last_child_count:
                 empty_scrolls += 1
@@ -887,19 +955,30 @@ class GoogleMapsBrandScraper:
     brand extraction logic.
     """
 
-    def __init__(self, headless: bool = False, timeout: int = 30000, use_proxies: bool = False, proxy_manager: Optional[ProxyManager] = None):
+    def __init__(
+        self,
+        headless: bool = False,
+        timeout: int = 30000,
+        use_proxies: bool = False,
+        proxy_manager: Optional[ProxyManager] = None,
+        keep_session: bool = False,
+    ):
         """
         Initialize the brand scraper.
 
         Args:
             headless: Whether to run browser in headless mode
             timeout: Default timeout for element operations in milliseconds
+            keep_session: Reuse one session manager across scrape_brands calls
+                until cleanup() is called
         """
         self.headless = headless
         self.timeout = timeout
         self.logger = logging.getLogger(__name__)
         self.use_proxies = use_proxies
         self.proxy_manager = proxy_manager
+        self.keep_session = keep_session
+        self._session_manager: Optional[GoogleMapsSessionManager] = None
         self._debug_event_counter = 0
         debug_env = os.getenv("GMAPS_DEBUG_SNAPSHOTS") or os.getenv("GMAPS_DEBUG_DUMPS")
         self.debug_snapshots_enabled = self._parse_debug_flag(debug_env)
@@ -907,14 +986,6 @@ class GoogleMapsBrandScraper:
         if not hasattr(self, "_debug_dump"):
             self._debug_dump = lambda *args, **kwargs: None
 
-        # Configure logging
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
-
     def scrape_brands(self, url: str) -> List[str]:
         """
         Scrape all brands from a Google Maps business listing URL.
@@ -927,30 +998,17 @@ class GoogleMapsBrandScraper:
         """
         self.logger.info(f"Starting brand scrape for URL: {url}")
 
-        # Use session manager for authenticated browsing
-        session_kwargs = {
-            "headless": self.headless,
-            "proxy_manager": (self.proxy_manager if self.use_proxies else None),
-            "max_auth_attempts": (1 if self.use_proxies else 3),
-        }
-
-        if not self.headless:
-            session_kwargs.update(
-                {
-                    "record_har": True,
-                    "har_output_dir": "debug/har",
-                }
-            )
-
-        session_manager = GoogleMapsSessionManager(**session_kwargs)
-
+        session_manager = self._get_session_manager()
         page = None
         nav_handler = None
 
         try:
             self._debug_event_counter = 0
-            # Get authenticated page
-            page = session_manager.get_authenticated_page(target_url=url)
+            # A kept session loads each URL in its one long-lived page instead of opening another
+            if self.keep_session:
+                page = session_manager.navigate(url)
+            else:
+                page = session_manager.get_authenticated_page(target_url=url)
 
             def _on_navigation(frame):
                 if frame is None or frame.page is None:
@@ -981,12 +1039,15 @@ class GoogleMapsBrandScraper:
             # Handle scenarios where navigation sends us back to consent page
             if "consent.google.com" in page.url:
                 self.logger.info("Redirected to consent page after navigation; re-running consent handler")
-                session_manager._handle_consent_flow(page)
+                session_manager._handle_consent_flow(
+                    page,
+                    ready_selector=DIRECTORY_READY_SELECTOR,
+                    ready_timeout=min(self.timeout, 8000),
+                )
                 try:
                     page.wait_for_load_state("domcontentloaded", timeout=5000)
                 except PlaywrightTimeoutError:
                     self.logger.debug("Consent retry did not reach DOM loaded within 5s; proceeding")
-                page.wait_for_timeout(1500)
                 if "consent.google.com" in page.url:
                     raise RuntimeError("Unable to pass consent page after retry")
             else:
@@ -999,7 +1060,6 @@ class GoogleMapsBrandScraper:
                         page.wait_for_load_state("load", timeout=5000)
                     except PlaywrightTimeoutError:
                         self.logger.debug("Page load wait timed out; proceeding regardless")
-                page.wait_for_timeout(1200)
 
             # NOW add directory parameters after consent is handled
             self._ensure_directory_view(page)
@@ -1015,13 +1075,44 @@ class GoogleMapsBrandScraper:
             return []
 
         finally:
-            session_manager.cleanup()
+            if session_manager is not self._session_manager:
+                session_manager.cleanup()
             if page is not None and nav_handler is not None:
                 try:
                     page.off("framenavigated", nav_handler)
                 except Exception:
                     pass
 
+    def cleanup(self):
+        """Close the session manager kept between scrape_brands calls, if any."""
+        session_manager, self._session_manager = self._session_manager, None
+        if session_manager is not None:
+            session_manager.cleanup()
+
+    def _get_session_manager(self) -> GoogleMapsSessionManager:
+        """Return the kept session manager, or build one for authenticated browsing."""
+        if self._session_manager is not None:
+            return self._session_manager
+
+        session_kwargs = {
+            "headless": self.headless,
+            "proxy_manager": (self.proxy_manager if self.use_proxies else None),
+            "max_auth_attempts": (1 if self.use_proxies else 3),
+        }
+
+        if not self.headless:
+            session_kwargs.update(
+                {
+                    "record_har": True,
+                    "har_output_dir": "debug/har",
+                }
+            )
+
+        session_manager = GoogleMapsSessionManager(**session_kwargs)
+        if self.keep_session:
+            self._session_manager = session_manager
+        return session_manager
+
     def _add_directory_parameters(self, url: str) -> str:
         """Add directory view parameters to URL before navigation."""
         # For short Google Maps URLs, we can't predict the final URL
@@ -1058,7 +1149,7 @@ class GoogleMapsBrandScraper:
             page.goto(new_url, wait_until="domcontentloaded", timeout=15000)
             self.logger.info(f"Directory view navigation completed: {page.url}")
             # Wait for directory content to load
-            page.wait_for_timeout(5000)
+            _wait_for_directory(page, logger=self.logger)
             self._debug_dump(page, label="state-directory-direct")
             return True
         except Exception as exc:
@@ -1076,8 +1167,8 @@ class GoogleMapsBrandScraper:
         self.logger.info("[EXTRACTION] Relying on URL manipulation (!10e3!16s) for directory expansion")
         self._debug_dump(page, label="state-directory-ready")
 
-        # Brief wait for any dynamic content to settle after URL-based directory activation
-        page.wait_for_timeout(1000)
+        # Returns at once when the directory is already on screen
+        _wait_for_directory(page, timeout_ms=1000, logger=self.logger)
 
         collected_cards: Dict[Tuple[str, Optional[str], Optional[str]], Dict[str, Optional[str]]] = {}
 
@@ -1166,8 +1257,12 @@ class GoogleMapsBrandScraper:
             'notes': 'Scraped using consent handler and directory expansion'
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if orjson:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
 
         self.logger.info(f"Results saved to {filename}")
         return filename
@@ -1205,7 +1300,12 @@ class GoogleMapsBrandScraper:
 
     @staticmethod
     def _sanitize_label(label: str) -> str:
-        safe = re.sub(r"[^A-Za-z0-9_-]+", "-", label or "")
+        label = label or ""
+        # Fast path: labels made only of safe ASCII characters need no substitution
+        if label.isascii() and not label.translate(_LABEL_SAFE_CHARS_TABLE):
+            safe = label
+        else:
+            safe = _LABEL_SANITIZE_RE.sub("-", label)
         safe = safe.strip("-_")
         if len(safe) > 80:
             safe = safe[:80]
@@ -1258,13 +1358,15 @@ def main():
     args = parser.parse_args()
 
     # Configure logging
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        logging.basicConfig(level=logging.INFO)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
 
     # Create scraper
-    proxy_mgr = create_default_proxy_manager() if args.use_proxies else None
+    proxy_mgr = None
+    if args.use_proxies:
+        proxy_mgr = create_default_proxy_manager()
     scraper = GoogleMapsBrandScraper(headless=not args.headed, use_proxies=args.use_proxies, proxy_manager=proxy_mgr)
 
     # Scrape brands
@@ -1273,15 +1375,18 @@ def main():
     # Save results
     filename = scraper.save_results(brands, args.url, args.output)
 
-    # Print summary
-    print(f"\nScraping completed!")
-    print(f"Found {len(brands)} brands at {args.url}")
-    print(f"Results saved to: {filename}")
+    # Print summary as one write rather than one per brand
+    summary = [
+        "\nScraping completed!",
+        f"Found {len(brands)} brands at {args.url}",
+        f"Results saved to: {filename}",
+    ]
 
     if brands:
-        print("\nBrands found:")
-        for brand in brands:
-            print(f"  - {brand}")
+        summary.append("\nBrands found:")
+        summary.extend(f"  - {brand}" for brand in brands)
+
+    print("\n".join(summary))
 
 
 if __name__ == '__main__':
@@ -13,13 +13,22 @@ Usage:
 
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
+import re
+import signal
+import subprocess
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from playwright.sync_api import (
     sync_playwright,
@@ -28,8 +37,296 @@ from playwright.sync_api import (
     Page,
     TimeoutError,
 )
+from playwright.async_api import (
+    async_playwright,
+    Browser as AsyncBrowser,
+    BrowserContext as AsyncBrowserContext,
+    Page as AsyncPage,
+)
+from google_consent_handler import GoogleConsentHandler
 from proxy_manager import ProxyManager
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+__all__ = [
+    "AsyncGoogleMapsSessionManager",
+    "GoogleMapsSessionManager",
+    "get_authenticated_page",
+    "stop_persistent_browser",
+]
+
+
+# Shared by every manager instance
+_logger = logging.getLogger(__name__)
+
+
+_CHROMIUM_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    # /dev/shm is tiny in containers; fall back to /tmp instead of crashing tabs
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-background-networking',
+)
+
+# Fingerprint shared by every context, proxied or not
+_BASE_CONTEXT_KWARGS = MappingProxyType(
+    {
+        "user_agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+        ),
+        "locale": "en-GB",
+        "timezone_id": "Europe/London",
+    }
+)
+
+# Priority order; the union only waits for whichever paints first
+_CONSENT_ACCEPT_SELECTORS = (
+    'button:has-text("Accept all")',
+    'button:has-text("I agree")',
+    '[aria-label*="Accept"]',
+    'button[jslog*="103597"]',
+)
+_CONSENT_ACCEPT_SELECTOR = ", ".join(_CONSENT_ACCEPT_SELECTORS)
+
+# Cookies Google sets once consent is given; either one means no consent page
+_CONSENT_COOKIE_NAMES = frozenset({"CONSENT", "SOCS"})
+
+# Runs before any page script; clicks "Accept all" as soon as the consent dialog renders
+_CONSENT_AUTOCLICK_SCRIPT = """
+(() => {
+  if (location.hostname !== 'consent.google.com') return;
+  const accept = () => {
+    const buttons = document.querySelectorAll('button, [role="button"]');
+    for (const button of buttons) {
+      const label = (button.getAttribute('aria-label') || button.textContent || '').trim();
+      if (/^(accept all|i agree)$/i.test(label) || /accept/i.test(button.getAttribute('aria-label') || '')) {
+        button.click();
+        return true;
+      }
+    }
+    return false;
+  };
+  const observer = new MutationObserver(() => {
+    if (accept()) observer.disconnect();
+  });
+  observer.observe(document.documentElement, {childList: true, subtree: true});
+})();
+"""
+
+# Rendered once the Maps app has booted, whichever view it lands on
+_MAPS_READY_SELECTOR = 'input#searchboxinput, [role="feed"], [role="main"]'
+
+# Sub-resources the auth/consent phase never reads. CSS stays: visibility-based
+# waits depend on layout, so pass blocked_resource_types to opt into more.
+_AUTH_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_ANALYTICS_HOST_RE = re.compile(r"googletagmanager|google-analytics|doubleclick")
+# Same paths as the "**/recaptcha/**" glob on google.com and gstatic.com
+_RECAPTCHA_URL_RE = re.compile(r"^https://www\.(?:google|gstatic)\.com/recaptcha/")
+
+# Process-wide Chromium instances shared by every session manager
+_BROWSER_POOL: Dict[Tuple[bool, Optional[str]], Browser] = {}
+_BROWSER_POOL_LOCK = threading.Lock()
+_PLAYWRIGHT = None
+
+
+def _get_or_launch_browser(headless: bool, proxy_server: Optional[str] = None) -> Browser:
+    """Return a pooled browser for ``(headless, proxy_server)``, launching it on first use."""
+    global _PLAYWRIGHT
+
+    key = (headless, proxy_server)
+    with _BROWSER_POOL_LOCK:
+        browser = _BROWSER_POOL.get(key)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = sync_playwright().start()
+
+        launch_kwargs = {"headless": headless, "args": list(_CHROMIUM_LAUNCH_ARGS)}
+        if proxy_server:
+            launch_kwargs["proxy"] = {"server": proxy_server}
+
+        browser = _PLAYWRIGHT.chromium.launch(**launch_kwargs)
+        _BROWSER_POOL[key] = browser
+        return browser
+
+
+def _spawn_debuggable_chromium(headless: bool, profile_dir: Path, timeout: float = 15.0) -> str:
+    """Start a detached Chromium with remote debugging and return its CDP websocket URL.
+
+    The process outlives this interpreter, which is what lets later CLI runs
+    reconnect instead of paying for a cold start.
+    """
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    port_file = profile_dir / "DevToolsActivePort"
+    port_file.unlink(missing_ok=True)
+
+    args = [
+        _PLAYWRIGHT.chromium.executable_path,
+        *_CHROMIUM_LAUNCH_ARGS,
+        "--remote-debugging-port=0",
+        f"--user-data-dir={profile_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+    if headless:
+        args.append("--headless=new")
+    args.append("about:blank")
+
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    # Recorded so stop_persistent_browser() can shut the detached process down
+    _atomic_write_bytes(profile_dir.parent / "browser.pid", str(process.pid).encode("utf-8"))
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            port, ws_path = port_file.read_text().splitlines()[:2]
+            return f"ws://127.0.0.1:{port}{ws_path}"
+        except (FileNotFoundError, ValueError):
+            time.sleep(0.1)
+    raise TimeoutError(f"Chromium did not publish a debugging endpoint within {timeout}s")
+
+
+def _connect_or_launch_browser(headless: bool, endpoint_file: Path) -> Browser:
+    """Reconnect to the browser recorded in ``endpoint_file`` or start a persistent one."""
+    global _PLAYWRIGHT
+
+    key = (headless, f"cdp:{endpoint_file}")
+    with _BROWSER_POOL_LOCK:
+        browser = _BROWSER_POOL.get(key)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = sync_playwright().start()
+
+        if endpoint_file.exists():
+            ws_endpoint = endpoint_file.read_text().strip()
+            try:
+                browser = _PLAYWRIGHT.chromium.connect_over_cdp(ws_endpoint, timeout=3000)
+                _logger.info("Reconnected to running browser at %s", ws_endpoint)
+            except Exception as exc:
+                _logger.debug("Stale browser endpoint %s: %s", ws_endpoint, exc)
+                endpoint_file.unlink(missing_ok=True)
+                browser = None
+
+        if browser is None or not browser.is_connected():
+            ws_endpoint = _spawn_debuggable_chromium(headless, endpoint_file.parent / "browser-profile")
+            _atomic_write_bytes(endpoint_file, ws_endpoint.encode("utf-8"))
+            browser = _PLAYWRIGHT.chromium.connect_over_cdp(ws_endpoint)
+            _logger.info("Launched persistent browser at %s", ws_endpoint)
+
+        _BROWSER_POOL[key] = browser
+        return browser
+
+
+def stop_persistent_browser(session_dir: Path) -> bool:
+    """Kill the detached Chromium recorded under ``session_dir``; return whether one was running."""
+    endpoint_file = session_dir / "ws.endpoint"
+    pid_file = session_dir / "browser.pid"
+
+    with _BROWSER_POOL_LOCK:
+        for key in [key for key in _BROWSER_POOL if key[1] == f"cdp:{endpoint_file}"]:
+            _BROWSER_POOL.pop(key)
+
+    stopped = False
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (FileNotFoundError, ValueError):
+        pid = None
+
+    if pid is not None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            stopped = True
+            _logger.info("Stopped persistent browser (pid %s)", pid)
+        except ProcessLookupError:
+            _logger.debug("Persistent browser pid %s was not running", pid)
+
+    endpoint_file.unlink(missing_ok=True)
+    pid_file.unlink(missing_ok=True)
+    return stopped
+
+
+def _drain_pool():
+    """Close every pooled browser and stop Playwright."""
+    global _PLAYWRIGHT
+
+    with _BROWSER_POOL_LOCK:
+        for browser in _BROWSER_POOL.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+        _BROWSER_POOL.clear()
+
+        try:
+            if _PLAYWRIGHT:
+                _PLAYWRIGHT.stop()
+        except Exception:
+            pass
+        finally:
+            _PLAYWRIGHT = None
+
+
+atexit.register(_drain_pool)
+
+
+def _playwright_proxy_config(proxy: Dict) -> Dict[str, Optional[str]]:
+    return {
+        "server": f"http://{proxy['ip']}:{proxy['port']}",
+        "username": proxy.get("username"),
+        "password": proxy.get("password"),
+    }
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file and rename it over ``path``."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _dumps(value) -> bytes:
+    return orjson.dumps(value) if orjson else json.dumps(value).encode("utf-8")
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _normalize_url(url: str) -> str:
+    """Strip the fragment and trailing slashes so equivalent Maps URLs compare equal."""
+    return url.split("#", 1)[0].rstrip("/")
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _origin_shard_name(origin: str) -> str:
+    return hashlib.blake2b(origin.encode("utf-8"), digest_size=8).hexdigest() + ".json"
+
+
+def _priority_consent_button(page: Page):
+    """Return the highest-priority visible accept button; the union's .first is DOM order."""
+    for selector in _CONSENT_ACCEPT_SELECTORS:
+        button = page.locator(selector).first
+        if button.is_visible():
+            return button
+    return page.locator(_CONSENT_ACCEPT_SELECTOR).first
+
 
 class GoogleMapsSessionManager:
     """
@@ -42,6 +339,9 @@ class GoogleMapsSessionManager:
     - Helper methods for recaptcha detection and graceful cleanup
     """
 
+    # Seconds a proxy that failed in this session is skipped before being retried
+    GREYLIST_TTL_SECONDS = 600.0
+
     def __init__(
         self,
         headless: bool = False,
@@ -50,19 +350,35 @@ class GoogleMapsSessionManager:
         max_auth_attempts: int = 2,
         record_har: bool = False,
         har_output_dir: Optional[str] = None,
+        har_full: bool = False,
+        persist_browser: bool = False,
+        blocked_resource_types: Optional[Iterable[str]] = None,
     ):
         """Initialise the session manager."""
         self.headless = headless
+        self.blocked_resource_types = frozenset(
+            _AUTH_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types
+        )
+        self._aborted_requests = 0
+        self.persist_browser = persist_browser
         self._base_session_dir = Path(user_data_dir or ".gmaps_sessions")
         self._base_session_dir.mkdir(parents=True, exist_ok=True)
         self.user_data_dir_path: Path = self._base_session_dir / "default"
         self.storage_state_path: Path = self.user_data_dir_path / "storage_state.json"
-        self.logger = logging.getLogger(__name__)
+        self.storage_state_dir: Path = self.user_data_dir_path / "storage_state"
+        # Created up front so saves never stat the directory tree
+        (self.storage_state_dir / "origins").mkdir(parents=True, exist_ok=True)
+        self.logger = _logger
         self.proxy_manager = proxy_manager
         self._current_proxy_info = None
+        self._proxy_blocked = False
+        self._session_greylist: Dict[str, float] = {}
+        self._proxy_contexts: Dict[str, BrowserContext] = {}
         self.max_auth_attempts = max_auth_attempts
         self._recaptcha_detected = False
+        self._consent_handler = GoogleConsentHandler()
         self.record_har = record_har
+        self.har_full = har_full
         if record_har:
             output_dir = Path(har_output_dir or "debug/har")
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -70,116 +386,165 @@ class GoogleMapsSessionManager:
         else:
             self.har_output_dir = None
 
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
-
-        self._playwright = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._active_har_path: Optional[Path] = None
-
-    def get_authenticated_page(self, target_url: Optional[str] = None) -> Page:
-        """Return a page that is navigated to ``target_url`` with consent handled."""
+        self._storage_dirty = False
+        self._auth_routing_active = False
+        self._recaptcha_routing_active = False
+        self._consent_autoclick_active = False
+        self._last_nav_url: Optional[str] = None
+        self._probe_page: Optional[Page] = None
+        self._page: Optional[Page] = None
+
+    def get_authenticated_page(
+        self,
+        target_url: Optional[str] = None,
+        proxy_override: Optional[Dict] = None,
+    ) -> Page:
+        """Return a page that is navigated to ``target_url`` with consent handled.
+
+        ``proxy_override`` pins a single attempt to one proxy from the manager's
+        pool, so a single manager (and browser) can probe many proxies in turn;
+        a failure on that proxy is raised rather than retried on another.
+        """
         target_url = target_url or "https://www.google.com/maps"
         self.logger.info("Getting authenticated Google Maps page...")
 
-        if self.proxy_manager:
-            return self._get_page_with_proxy_simple(target_url)
-
-        return self._get_page_with_session_management(target_url)
+        if proxy_override is not None and not self.proxy_manager:
+            raise ValueError("proxy_override requires a proxy_manager")
 
-    def _get_page_with_proxy_simple(self, target_url: str) -> Page:
-        """Simplified proxy flow that launches a fresh browser per attempt."""
+        if self.proxy_manager:
+            self._page = self._get_page_with_proxy_simple(target_url, proxy_override)
+        else:
+            self._page = self._get_page_with_session_management(target_url)
+        return self._page
+
+    def navigate(self, target_url: str) -> Page:
+        """Load ``target_url`` in the manager's long-lived page, opening it only if needed.
+
+        Use ``get_authenticated_page`` instead when a caller needs a page of its own.
+        """
+        if self._page is None or self._page.is_closed():
+            return self.get_authenticated_page(target_url)
+
+        self._page.goto(target_url, wait_until="domcontentloaded", timeout=15000)
+        if "consent.google.com" in self._page.url:
+            self._handle_consent_flow(self._page)
+        return self._page
+
+    def _get_page_with_proxy_simple(
+        self, target_url: str, proxy_override: Optional[Dict] = None
+    ) -> Page:
+        """Simplified proxy flow that keeps one proxied context per proxy."""
         last_error: Optional[Exception] = None
+        max_attempts = 1 if proxy_override is not None else self.max_auth_attempts
 
-        for attempt in range(1, self.max_auth_attempts + 1):
-            proxy = self.proxy_manager.get_working_proxy(max_attempts=3)
+        for attempt in range(1, max_attempts + 1):
+            proxy = proxy_override or self._acquire_proxy(max_attempts=3)
             if not proxy:
                 break
 
             self._current_proxy_info = proxy
-            proxy_config = {
-                "server": f"http://{proxy['ip']}:{proxy['port']}",
-                "username": proxy.get("username"),
-                "password": proxy.get("password"),
-            }
+            self._proxy_blocked = False
+            proxy_config = _playwright_proxy_config(proxy)
             self.logger.info(
                 "Proxy attempt %s/%s using %s:%s",
                 attempt,
-                self.max_auth_attempts,
+                max_attempts,
                 proxy["ip"],
                 proxy["port"],
             )
 
+            context_key = proxy.get("slug") or self._proxy_key(proxy)
             try:
-                if self._playwright is None:
-                    self._playwright = sync_playwright().start()
-
-                self._browser = self._playwright.chromium.launch(
-                    headless=self.headless,
-                    proxy=proxy_config,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-web-security',
-                        '--disable-features=VizDisplayCompositor',
-                    ],
-                )
-
-                context_kwargs = {
-                    "user_agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-                    ),
-                    "locale": "en-GB",
-                    "timezone_id": "Europe/London",
-                }
-
-                if self.record_har and self.har_output_dir:
-                    timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-                    har_name = f"session_{timestamp}.har"
-                    har_path = self.har_output_dir / har_name
-                    context_kwargs["record_har_path"] = str(har_path)
-                    context_kwargs["record_har_mode"] = "full"
-                    self._active_har_path = har_path
-                    self.logger.info("Recording HAR to %s", har_path)
-
-                self._context = self._browser.new_context(**context_kwargs)
+                # Chromium is launched once; each proxy keeps its own cheap context
+                self._context = self._proxy_contexts.get(context_key)
+                if self._context is None:
+                    context_kwargs = {**_BASE_CONTEXT_KWARGS, "proxy": proxy_config}
+                    context_kwargs.update(self._har_context_kwargs())
+                    self._context = self._ensure_browser().new_context(**context_kwargs)
+                    self._proxy_contexts[context_key] = self._context
+                    # No auth-phase routing here: the one goto below is the target load,
+                    # and blocking its assets would force a second navigation
+                    self._install_consent_autoclick()
+                else:
+                    self.logger.debug("Reusing context for proxy %s", context_key)
 
                 page = self._context.new_page()
                 self.logger.info("Navigating to: %s", target_url)
                 start_time = time.time()
-                page.goto(target_url, wait_until="domcontentloaded", timeout=60000)
+                # Return on the first response; the selector wait below covers readiness
+                page.goto(target_url, wait_until="commit", timeout=30000)
                 elapsed = time.time() - start_time
-                self.logger.info("Navigation completed in %.1fs", elapsed)
+                self.logger.info("Navigation committed in %.1fs", elapsed)
 
                 if "consent.google.com" in page.url:
                     self.logger.info("Consent page detected, handling...")
                     self._handle_consent_simple(page)
 
                 try:
-                    page.wait_for_load_state("networkidle", timeout=10000)
-                except Exception:
-                    pass
+                    page.wait_for_selector(_MAPS_READY_SELECTOR, state="visible", timeout=8000)
+                except TimeoutError:
+                    self.logger.debug("Maps UI not visible yet on %s; continuing", page.url)
 
                 self.logger.info("Final URL: %s", page.url)
-                self.logger.info("Page title: %s", page.title())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # The title is a renderer round-trip; only fetch it for debug output
+                    self.logger.debug("Page title: %s", page.title())
                 self.proxy_manager.record_success(proxy)
                 return page
 
             except Exception as exc:
                 last_error = exc
                 self.logger.error("Proxy navigation failed: %s", exc)
+                self._proxy_blocked = True
                 if self._current_proxy_info:
+                    self._session_greylist[self._proxy_key(self._current_proxy_info)] = time.monotonic()
                     self.proxy_manager.record_failure(self._current_proxy_info, block=True)
-                self.cleanup()
+                self._proxy_contexts.pop(context_key, None)
+                self._close_context()
                 continue
 
         raise last_error or Exception("Unable to load target URL with available proxies")
 
+    @staticmethod
+    def _proxy_key(proxy: Dict) -> str:
+        return f"{proxy['ip']}:{proxy['port']}"
+
+    def _is_greylisted(self, proxy: Dict) -> bool:
+        key = self._proxy_key(proxy)
+        failed_at = self._session_greylist.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at > self.GREYLIST_TTL_SECONDS:
+            del self._session_greylist[key]
+            return False
+        return True
+
+    def force_rotate(self):
+        """Drop the sticky proxy so the next acquisition probes for a new one."""
+        self._proxy_blocked = True
+        if self.proxy_manager:
+            self.proxy_manager.get_next_proxy()
+
+    def _acquire_proxy(self, max_attempts: int = 3) -> Optional[Dict]:
+        """Return a working proxy that has not already failed during this session."""
+        # Keep using the last proxy that worked; probing is an HTTP round-trip
+        if self._current_proxy_info is not None and not self._proxy_blocked:
+            return self._current_proxy_info
+
+        for _ in range(max(1, len(self.proxy_manager.proxies))):
+            proxy = self.proxy_manager.get_working_proxy(max_attempts=max_attempts)
+            if not proxy:
+                return None
+            if not self._is_greylisted(proxy):
+                self._proxy_blocked = False
+                return proxy
+            self.logger.debug("Skipping greylisted proxy %s", self._proxy_key(proxy))
+            self.proxy_manager.get_next_proxy()
+        return None
+
     def _get_page_with_session_management(self, target_url: str) -> Page:
         """Original persistent-session flow used when no proxy manager is supplied."""
         self._start_browser()
@@ -197,12 +562,17 @@ class GoogleMapsSessionManager:
             self._setup_consent_handler(page)
             page_reused = False
         else:
-            page = self._is_authenticated()
+            # Probe with the target itself so a healthy session needs no second navigation;
+            # that makes the probe the target load, so it must fetch the page's full assets
+            self._unroute_after_auth()
+            page = self._is_authenticated(probe_url=target_url)
             if page:
                 self.logger.info("Using existing authenticated session")
                 page_reused = True
             else:
                 self.logger.info("Setting up new authenticated session")
+                if not self._auth_routing_active:
+                    self._install_auth_routing()
                 last_error = None
                 for attempt in range(self.max_auth_attempts):
                     try:
@@ -218,13 +588,17 @@ class GoogleMapsSessionManager:
                             self.max_auth_attempts,
                             exc,
                         )
-                        try:
-                            self.cleanup()
-                        except Exception:
-                            pass
-                        self._start_browser()
-            if last_error:
-                raise last_error
+                        # Usually a consent timing hiccup: wiping cookies is far cheaper than a new context
+                        if attempt == 0:
+                            try:
+                                self._context.clear_cookies()
+                                continue
+                            except Exception as clear_exc:
+                                self.logger.debug("Failed to clear cookies: %s", clear_exc)
+                        # Keep the browser process alive; only a fresh context is needed
+                        self._reset_context()
+                if last_error:
+                    raise last_error
 
         if page is None or page.is_closed():
             page = self._context.new_page()
@@ -238,6 +612,9 @@ class GoogleMapsSessionManager:
         except Exception:
             pass
 
+        # Authentication is settled; let the target page load its full assets
+        self._unroute_after_auth()
+
         try:
             current_url = ""
             try:
@@ -245,13 +622,20 @@ class GoogleMapsSessionManager:
             except Exception:
                 current_url = ""
 
-            if not self._urls_match(current_url, target_url):
+            already_on_target = page_reused and self._last_nav_url == target_url
+            if not already_on_target and not self._urls_match(current_url, target_url):
                 self.logger.info("Navigating to target URL %s", target_url)
-                self.logger.info(f"[SESSION] Starting navigation from: {current_url}")
+                self.logger.info("[SESSION] Starting navigation from: %s", current_url)
                 page.goto(target_url, wait_until="domcontentloaded", timeout=15000)
-                self.logger.info(f"[SESSION] Navigation completed to: {page.url}")
-                # Brief wait for Google Maps SPA to initialize
-                page.wait_for_timeout(1000)
+                self.logger.info("[SESSION] Navigation completed to: %s", page.url)
+                # Let the Maps SPA finish its load event instead of sleeping a fixed second
+                try:
+                    page.wait_for_function(
+                        "window.performance.getEntriesByType('navigation')[0]?.loadEventEnd > 0",
+                        timeout=5000,
+                    )
+                except TimeoutError:
+                    self.logger.debug("Load event did not finish on %s; continuing", page.url)
             if "consent.google.com" in page.url:
                 self.logger.info("Consent page detected after navigation")
                 self._handle_consent_flow(page)
@@ -268,22 +652,13 @@ class GoogleMapsSessionManager:
 
     def _handle_consent_simple(self, page: Page):
         """Handle Google consent page using a lightweight strategy."""
-        selectors = [
-            'button:has-text("Accept all")',
-            'button:has-text("I agree")',
-            '[aria-label*="Accept"]',
-            'button[jslog*="103597"]',
-        ]
-
-        for selector in selectors:
-            try:
-                button = page.locator(selector).first
-                if button.is_visible(timeout=5000):
-                    button.click()
-                    self.logger.info("Clicked consent button: %s", selector)
-                    break
-            except Exception:
-                continue
+        # One union locator waits for whichever button paints first
+        try:
+            page.locator(_CONSENT_ACCEPT_SELECTOR).first.wait_for(state="visible", timeout=5000)
+            _priority_consent_button(page).click()
+            self.logger.info("Clicked consent button")
+        except Exception as exc:
+            self.logger.debug("No consent button became visible: %s", exc)
 
         try:
             page.wait_for_url(lambda url: "consent.google.com" not in url, timeout=15000)
@@ -292,74 +667,163 @@ class GoogleMapsSessionManager:
             self.logger.warning("Still on consent page after attempting acceptance")
 
     def _start_browser(self):
-        """Start the browser with persistent context."""
+        """Start the browser (if needed) and open a context unless the current one is still live."""
         Path(self.user_data_dir_path).mkdir(parents=True, exist_ok=True)
-
-        if self._playwright is None:
-            self._playwright = sync_playwright().start()
-
+        browser = self._ensure_browser()
+        if self._context is not None and self._context in browser.contexts:
+            return
+        # The old context died with a disconnected browser; drop our handles to it
+        self._close_context()
+        self._new_context()
+
+    def _ensure_browser(self) -> Browser:
+        """Check out the pooled Chromium instance, launching it only once per process."""
+        if self._browser is None or not self._browser.is_connected():
+            self._browser = self.launch_or_connect()
+        return self._browser
+
+    def launch_or_connect(self) -> Browser:
+        """Return a browser, reusing one left running by an earlier run when ``persist_browser`` is set."""
+        if self.persist_browser:
+            return _connect_or_launch_browser(self.headless, self._base_session_dir / "default" / "ws.endpoint")
+        return _get_or_launch_browser(self.headless)
+
+    def stop_persistent_browser(self) -> bool:
+        """Shut down the Chromium that ``persist_browser`` left running for this session dir."""
+        self._close_context()
+        self._browser = None
+        return stop_persistent_browser(self._base_session_dir / "default")
+
+    def _new_context(self) -> BrowserContext:
+        """Create a browser context, applying the current proxy per context."""
         proxy_kwargs = {}
         if self.proxy_manager:
             try:
-                proxy = self.proxy_manager.get_working_proxy() or self.proxy_manager.get_current_proxy()
+                proxy = self._acquire_proxy() or self.proxy_manager.get_current_proxy()
                 if proxy:
                     self._current_proxy_info = proxy
-                    proxy_kwargs = {
-                        "proxy": {
-                            "server": f"http://{proxy['ip']}:{proxy['port']}",
-                            "username": proxy.get("username"),
-                            "password": proxy.get("password"),
-                        }
-                    }
+                    proxy_kwargs = {"proxy": _playwright_proxy_config(proxy)}
                     self.logger.info("Using proxy %s:%s", proxy["ip"], proxy["port"])
                     proxy_dir = self._base_session_dir / proxy["slug"]
-                    proxy_dir.mkdir(parents=True, exist_ok=True)
                     self.user_data_dir_path = proxy_dir
                     self.storage_state_path = proxy_dir / "storage_state.json"
+                    self.storage_state_dir = proxy_dir / "storage_state"
+                    (self.storage_state_dir / "origins").mkdir(parents=True, exist_ok=True)
             except Exception as exc:
                 self.logger.warning("Proxy setup failed, continuing without proxy: %s", exc)
                 self._current_proxy_info = None
 
-        self._browser = self._playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-            ],
-            **proxy_kwargs,
-        )
+        storage_state = self._load_storage_state()
+        context_kwargs = {**_BASE_CONTEXT_KWARGS, **proxy_kwargs}
 
-        storage_state = self.storage_state_path if self.storage_state_path.exists() else None
-        context_kwargs = {
-            "user_agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-            ),
-            "locale": "en-GB",
-            "timezone_id": "Europe/London",
+        if storage_state:
+            context_kwargs["storage_state"] = storage_state
+
+        context_kwargs.update(self._har_context_kwargs())
+
+        self._context = self._ensure_browser().new_context(**context_kwargs)
+        self._install_auth_routing()
+        self._install_consent_autoclick()
+        return self._context
+
+    def _har_context_kwargs(self) -> Dict[str, str]:
+        """HAR recording options; bodies are omitted unless ``har_full`` was requested."""
+        if not (self.record_har and self.har_output_dir):
+            return {}
+
+        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        har_path = self.har_output_dir / f"session_{timestamp}.har"
+        self._active_har_path = har_path
+        self.logger.info("Recording HAR to %s", har_path)
+
+        if self.har_full:
+            return {"record_har_path": str(har_path), "record_har_mode": "full"}
+        return {
+            "record_har_path": str(har_path),
+            "record_har_mode": "minimal",
+            "record_har_content": "omit",
         }
 
-        if storage_state:
-            context_kwargs["storage_state"] = str(storage_state)
+    def _auth_phase_router(self, route):
+        """Abort heavy sub-resources and analytics beacons during authentication."""
+        request = route.request
+        if request.resource_type in self.blocked_resource_types or _ANALYTICS_HOST_RE.search(request.url):
+            self._aborted_requests += 1
+            route.abort()
+        else:
+            route.fallback()
 
-        if self.record_har and self.har_output_dir:
-            timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-            har_name = f"session_{timestamp}.har"
-            har_path = self.har_output_dir / har_name
-            context_kwargs["record_har_path"] = str(har_path)
-            context_kwargs["record_har_mode"] = "full"
-            self._active_har_path = har_path
-            self.logger.info("Recording HAR to %s", har_path)
+    def _install_auth_routing(self):
+        try:
+            self._context.route("**/*", self._auth_phase_router)
+            self._auth_routing_active = True
+        except Exception as exc:
+            self.logger.debug("Failed to install auth-phase routing: %s", exc)
 
-        self._context = self._browser.new_context(**context_kwargs)
+    def _unroute_after_auth(self):
+        if not self._context:
+            return
+        if self._recaptcha_routing_active:
+            try:
+                self._context.unroute(_RECAPTCHA_URL_RE, self._recaptcha_route)
+            except Exception as exc:
+                self.logger.debug("Failed to remove recaptcha route: %s", exc)
+            finally:
+                self._recaptcha_routing_active = False
+        if not self._auth_routing_active:
+            return
+        try:
+            self._context.unroute("**/*", self._auth_phase_router)
+        except Exception as exc:
+            self.logger.debug("Failed to remove auth-phase routing: %s", exc)
+        finally:
+            self._auth_routing_active = False
+            self.logger.info("Blocked %s requests during authentication", self._aborted_requests)
+
+    def _close_context(self):
+        """Close the active context while leaving the browser running."""
+        try:
+            if self._context:
+                self._context.close()
+        except Exception:
+            pass
+        finally:
+            self._context = None
+            self._auth_routing_active = False
+            self._recaptcha_routing_active = False
+            self._consent_autoclick_active = False
+            self._probe_page = None
+            self._page = None
+
+    def _reset_context(self):
+        """Replace the active context with a fresh one on the same browser."""
+        self._close_context()
+        self._new_context()
 
     def _storage_state_is_fresh(self, max_age_seconds: int = 3600) -> bool:
         try:
-            if not self.storage_state_path.exists():
+            manifest_path = self.storage_state_dir / "manifest.json"
+            state_path = manifest_path if manifest_path.exists() else self.storage_state_path
+            if not state_path.exists():
+                return False
+            age = time.time() - state_path.stat().st_mtime
+            if age >= max_age_seconds:
+                return False
+
+            # A truncated file from an aborted run must not count as a valid session
+            if state_path == manifest_path:
+                cookies = _loads((self.storage_state_dir / "cookies.json").read_bytes())
+            else:
+                cookies = _loads(state_path.read_bytes()).get("cookies")
+            # Only an unexpired consent cookie proves the consent flow completed
+            if not isinstance(cookies, list):
                 return False
-            age = time.time() - self.storage_state_path.stat().st_mtime
-            return age < max_age_seconds
+            now = time.time()
+            return any(
+                cookie.get("name") in _CONSENT_COOKIE_NAMES
+                and (cookie.get("expires", -1) == -1 or cookie.get("expires", -1) > now)
+                for cookie in cookies
+            )
         except Exception:
             return False
 
@@ -367,49 +831,49 @@ class GoogleMapsSessionManager:
     def _urls_match(current: str, target: str) -> bool:
         if not current or not target:
             return False
+        return _normalize_url(current) == _normalize_url(target)
 
-        def _normalize(url: str) -> str:
-            base = url.split("#", 1)[0]
-            if base.endswith("/"):
-                base = base.rstrip("/")
-            return base
-
-        return _normalize(current) == _normalize(target)
-
-    def _is_authenticated(self) -> Optional[Page]:
+    def _is_authenticated(self, probe_url: str = "https://www.google.com/maps") -> Optional[Page]:
         page: Optional[Page] = None
+        self._last_nav_url = None
         try:
-            page = self._context.new_page()
-            self._setup_consent_handler(page)
+            # A probe page left over from a failed check is reused rather than reopened
+            if self._probe_page is not None and not self._probe_page.is_closed():
+                page = self._probe_page
+            else:
+                page = self._context.new_page()
+                self._setup_consent_handler(page)
+            self._probe_page = None
             page.goto(
-                "https://www.google.com/maps",
+                probe_url,
                 wait_until="domcontentloaded",
                 timeout=15000,
             )
 
             if "consent.google.com" in page.url:
                 self.logger.debug("Authentication check hit consent page")
+                self._probe_page = page
                 return False
 
+            # Maps never goes network-idle; its search UI rendering is the real signal.
+            # A slow render is not a lost session: only the consent redirect above is.
             try:
-                page.wait_for_load_state("load", timeout=3000)
+                page.wait_for_selector(_MAPS_READY_SELECTOR, state="visible", timeout=4000)
             except TimeoutError:
-                self.logger.debug("Auth probe load wait timed out; continuing")
+                self.logger.debug("Maps UI did not render during auth probe; continuing")
 
             if self.proxy_manager and self._current_proxy_info:
                 self.proxy_manager.record_success(self._current_proxy_info)
 
+            self._last_nav_url = probe_url
             return page
 
         except Exception as exc:
             self.logger.debug("Authentication check failed: %s", exc)
             if self.proxy_manager and self._current_proxy_info:
                 self.proxy_manager.record_failure(self._current_proxy_info)
-            if page:
-                try:
-                    page.close()
-                except Exception:
-                    pass
+            if page and not page.is_closed():
+                self._probe_page = page
             return None
         finally:
             if page:
@@ -418,10 +882,13 @@ class GoogleMapsSessionManager:
 
     def _setup_authentication(self) -> Page:
         self.logger.info("Setting up Google authentication...")
-        page = self._context.new_page()
+        if self._probe_page is not None and not self._probe_page.is_closed():
+            page, self._probe_page = self._probe_page, None
+        else:
+            page = self._context.new_page()
 
         try:
-            self._attach_recaptcha_listeners(page)
+            self._attach_recaptcha_listeners()
             page.goto("https://www.google.com/maps", wait_until="domcontentloaded")
             self._setup_consent_handler(page)
 
@@ -430,7 +897,9 @@ class GoogleMapsSessionManager:
                 self._handle_consent_flow(page)
 
             self._wait_for_navigation(page)
-            self._save_storage_state()
+            # A completed auth always yields cookies worth keeping; write them once here
+            self._mark_storage_dirty()
+            self._flush_storage_state()
 
             if self._recaptcha_detected:
                 raise Exception("Recaptcha detected during authentication")
@@ -447,7 +916,18 @@ class GoogleMapsSessionManager:
                 pass
             raise
 
+    def _install_consent_autoclick(self):
+        """Register the consent auto-click script once for every page in the context."""
+        try:
+            self._context.add_init_script(_CONSENT_AUTOCLICK_SCRIPT)
+            self._consent_autoclick_active = True
+        except Exception as exc:
+            self.logger.debug("Failed to install consent auto-click script: %s", exc)
+
     def _setup_consent_handler(self, page: Page):
+        # Per-page locator handlers are only a fallback when the init script is missing
+        if self._consent_autoclick_active:
+            return
         try:
             page.add_locator_handler(
                 page.get_by_role("heading", name="Before you continue to Google"),
@@ -457,99 +937,416 @@ class GoogleMapsSessionManager:
         except Exception as exc:
             self.logger.debug("Failed to set up consent handler: %s", exc)
 
-    def _handle_consent_flow(self, page: Page):
-        from google_consent_handler import GoogleConsentHandler
-
-        handler = GoogleConsentHandler()
-        success = handler._accept_consent(page)
+    def _handle_consent_flow(self, page: Page, ready_selector: Optional[str] = None, ready_timeout: int = 20000):
+        success = self._consent_handler._accept_consent(page)
 
         if not success:
             raise Exception("Failed to automatically accept Google consent")
 
-        self._wait_for_navigation(page)
-        self._save_storage_state()
+        self._wait_for_navigation(page, timeout=ready_timeout, ready_selector=ready_selector)
+        self._mark_storage_dirty()
 
         if self._recaptcha_detected:
             self.logger.warning("Recaptcha was detected during consent handling")
 
     def _click_accept_all(self, page: Page):
+        # One union locator: a single 5s wait instead of a default-timeout click per fallback
         try:
-            page.get_by_role("button", name="Accept all").click()
+            page.locator(_CONSENT_ACCEPT_SELECTOR).first.wait_for(state="visible", timeout=5000)
+            _priority_consent_button(page).click()
             self.logger.info("Automatically accepted Google consent")
         except Exception as exc:
-            self.logger.debug("Failed to click Accept all: %s", exc)
-            try:
-                page.locator('[aria-label*="Accept"]').first.click()
-                self.logger.info("Accepted consent using aria-label")
-            except Exception as exc2:
-                self.logger.warning("Could not automatically accept consent: %s", exc2)
+            self.logger.warning("Could not automatically accept consent: %s", exc)
 
         try:
             self._wait_for_navigation(page)
-            self._save_storage_state()
+            self._mark_storage_dirty()
         except Exception as exc:
             self.logger.debug("Post-accept wait/storage failed: %s", exc)
 
-    def _wait_for_navigation(self, page: Page, timeout: int = 20000):
+    def _wait_for_navigation(self, page: Page, timeout: int = 20000, ready_selector: Optional[str] = None):
         try:
-            page.wait_for_load_state("domcontentloaded", timeout=timeout)
-            page.wait_for_timeout(1000)
-
-            start_time = time.monotonic()
-            while True:
-                current_url = page.url
-                self.logger.debug("Consent wait check URL: %s", current_url)
-                if "consent.google.com" not in current_url:
-                    break
-                if (time.monotonic() - start_time) * 1000 > timeout:
-                    raise TimeoutError("Still on consent page after waiting")
-                page.wait_for_timeout(500)
+            # Let Playwright poll the URL in the driver instead of looping in Python
+            page.wait_for_url(
+                lambda url: "consent.google.com" not in url,
+                timeout=timeout,
+                wait_until="commit",
+            )
 
             try:
-                page.wait_for_load_state("networkidle", timeout=timeout)
-                page.wait_for_timeout(1000)
+                page.wait_for_load_state("domcontentloaded", timeout=5000)
             except TimeoutError:
-                pass
+                self.logger.debug("DOM content load wait timed out after consent; continuing")
+
+            if ready_selector:
+                # Maps never settles to networkidle; wait for the UI the caller needs instead
+                try:
+                    page.locator(ready_selector).first.wait_for(state="visible", timeout=timeout)
+                except TimeoutError:
+                    self.logger.debug("Ready selector %s not visible after consent", ready_selector)
 
         except TimeoutError as exc:
             self.logger.error("Navigation timeout: %s", exc)
             raise
 
+    def _mark_storage_dirty(self):
+        """Flag storage state for persistence; the write happens in ``_flush_storage_state``."""
+        self._storage_dirty = True
+
+    def _flush_storage_state(self):
+        if self._storage_dirty:
+            self._save_storage_state()
+
+    def _read_storage_manifest(self) -> Dict:
+        manifest_path = self.storage_state_dir / "manifest.json"
+        try:
+            return _loads(manifest_path.read_bytes())
+        except Exception:
+            return {}
+
+    def _load_storage_state(self) -> Optional[Dict]:
+        """Rebuild the storage-state dict from its shards (or the legacy single file)."""
+        manifest = self._read_storage_manifest()
+        if manifest:
+            try:
+                cookies = _loads((self.storage_state_dir / "cookies.json").read_bytes())
+                origins_dir = self.storage_state_dir / "origins"
+                origins = [
+                    _loads((origins_dir / _origin_shard_name(origin)).read_bytes())
+                    for origin in manifest.get("origins", {})
+                ]
+                return {"cookies": cookies, "origins": origins}
+            except Exception as exc:
+                self.logger.debug("Failed to load sharded storage state: %s", exc)
+                return None
+
+        if self.storage_state_path.exists():
+            try:
+                return _loads(self.storage_state_path.read_bytes())
+            except Exception as exc:
+                self.logger.debug("Failed to load storage state: %s", exc)
+        return None
+
     def _save_storage_state(self):
+        """Persist storage state, rewriting only the cookie/origin shards that changed."""
         try:
-            if self._context:
-                state = self._context.storage_state()
-                self.storage_state_path.write_text(json.dumps(state))
-                self.logger.debug("Saved storage state to %s", self.storage_state_path)
+            if not self._context:
+                return
+
+            state = self._context.storage_state()
+            manifest = self._read_storage_manifest()
+            origins_dir = self.storage_state_dir / "origins"
+
+            written = 0
+            new_manifest: Dict = {"cookies": None, "origins": {}}
+
+            cookies_payload = _dumps(state.get("cookies", []))
+            new_manifest["cookies"] = _content_hash(cookies_payload)
+            if manifest.get("cookies") != new_manifest["cookies"]:
+                _atomic_write_bytes(self.storage_state_dir / "cookies.json", cookies_payload)
+                written += 1
+
+            previous_origins = manifest.get("origins", {})
+            for origin_state in state.get("origins", []):
+                origin = origin_state.get("origin", "")
+                payload = _dumps(origin_state)
+                digest = _content_hash(payload)
+                new_manifest["origins"][origin] = digest
+                if previous_origins.get(origin) != digest:
+                    _atomic_write_bytes(origins_dir / _origin_shard_name(origin), payload)
+                    written += 1
+
+            for origin in set(previous_origins) - set(new_manifest["origins"]):
+                (origins_dir / _origin_shard_name(origin)).unlink(missing_ok=True)
+                written += 1
+
+            manifest_path = self.storage_state_dir / "manifest.json"
+            if written or manifest != new_manifest:
+                _atomic_write_bytes(manifest_path, _dumps(new_manifest))
+                self.logger.debug("Saved %s storage shard(s) to %s", written, self.storage_state_dir)
+            else:
+                # Nothing changed; refresh the mtime so freshness checks stay accurate
+                os.utime(manifest_path)
+                self.logger.debug("Storage state unchanged; skipping write")
+
+            self._storage_dirty = False
         except Exception as exc:
             self.logger.warning("Failed to save storage state: %s", exc)
 
-    def _attach_recaptcha_listeners(self, page: Page):
+    def _attach_recaptcha_listeners(self):
+        """Flag recaptcha traffic via a URL-filtered route instead of a per-response callback."""
         self._recaptcha_detected = False
+        if self._recaptcha_routing_active:
+            return
+        try:
+            self._context.route(_RECAPTCHA_URL_RE, self._recaptcha_route)
+            self._recaptcha_routing_active = True
+        except Exception as exc:
+            self.logger.debug("Failed to install recaptcha route: %s", exc)
+
+    def _recaptcha_route(self, route):
+        self._recaptcha_detected = True
+        route.fallback()
+
+    def cleanup(self):
+        self._flush_storage_state()
+
+        # The browser goes back to the process-wide pool; only our contexts are closed
+        for context in self._proxy_contexts.values():
+            if context is self._context:
+                continue
+            try:
+                context.close()
+            except Exception:
+                pass
+        self._proxy_contexts.clear()
+        self._close_context()
+        self._browser = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
+
+
+class AsyncGoogleMapsSessionManager:
+    """
+    Async proxy flow that races several proxied contexts on one browser.
+
+    Instead of retrying proxies one after another (up to ``N x timeout`` when
+    early proxies hang), ``race_width`` contexts navigate concurrently and the
+    first page to load wins; the remaining attempts are cancelled and their
+    contexts closed. ``get_authenticated_pages`` fans a batch of URLs out over
+    a warm pool of ``pool_size`` contexts.
+    """
+
+    def __init__(
+        self,
+        headless: bool = False,
+        proxy_manager: Optional[ProxyManager] = None,
+        race_width: int = 3,
+        navigation_timeout: int = 60000,
+        pool_size: int = 3,
+        probe_timeout: Optional[float] = None,
+    ):
+        self.headless = headless
+        self.proxy_manager = proxy_manager
+        self.race_width = race_width
+        self.pool_size = pool_size
+        self.navigation_timeout = navigation_timeout
+        # Hard cap in seconds on one raced attempt; by default the navigation
+        # timeout plus a few seconds for consent handling, so it never cuts
+        # a navigation short
+        if probe_timeout is None:
+            probe_timeout = navigation_timeout / 1000 + 10
+        self.probe_timeout = probe_timeout
+        self.logger = _logger
+        self._playwright = None
+        self._browser: Optional[AsyncBrowser] = None
+        self._context: Optional[AsyncBrowserContext] = None
+        self._pool_contexts: Dict[str, AsyncBrowserContext] = {}
+        self._current_proxy_info = None
+
+    async def get_authenticated_page(self, target_url: Optional[str] = None) -> AsyncPage:
+        """Return a page loaded through whichever proxy reaches ``target_url`` first."""
+        target_url = target_url or "https://www.google.com/maps"
+        if not self.proxy_manager:
+            raise ValueError("AsyncGoogleMapsSessionManager requires a proxy manager")
+        return await self._race_proxies(target_url, k=self.race_width)
+
+    async def get_authenticated_pages(self, urls: List[str]) -> List[Optional[AsyncPage]]:
+        """
+        Load ``urls`` concurrently through a warm pool of proxied contexts.
+
+        At most ``pool_size`` navigations run at once, one per context. Pages are
+        returned in input order; a URL that fails to load yields ``None``.
+        """
+        contexts = await self._warm_context_pool()
+        queue: asyncio.Queue = asyncio.Queue()
+        for context in contexts:
+            queue.put_nowait(context)
+
+        async def _load(url: str) -> Optional[AsyncPage]:
+            context = await queue.get()
+            page = None
+            try:
+                page = await context.new_page()
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.navigation_timeout)
+                if "consent.google.com" in page.url:
+                    await self._handle_consent(page)
+                return page
+            except Exception as exc:
+                self.logger.error("Failed to load %s: %s", url, exc)
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+                return None
+            finally:
+                queue.put_nowait(context)
+
+        return list(await asyncio.gather(*(_load(url) for url in urls)))
+
+    async def _warm_context_pool(self) -> List[AsyncBrowserContext]:
+        """Open (or reuse) one context per proxy, up to ``pool_size``."""
+        if self._pool_contexts:
+            return list(self._pool_contexts.values())
+
+        browser = await self._ensure_browser()
+        if self.proxy_manager:
+            for proxy in await self._pick_proxies(self.pool_size):
+                key = proxy.get("slug") or GoogleMapsSessionManager._proxy_key(proxy)
+                self._pool_contexts[key] = await browser.new_context(
+                    **_BASE_CONTEXT_KWARGS, proxy=_playwright_proxy_config(proxy)
+                )
+        else:
+            for index in range(self.pool_size):
+                self._pool_contexts[f"direct-{index}"] = await browser.new_context(**_BASE_CONTEXT_KWARGS)
+
+        if not self._pool_contexts:
+            raise Exception("Unable to build a context pool with available proxies")
+        self.logger.info("Warmed %s browser contexts", len(self._pool_contexts))
+        return list(self._pool_contexts.values())
+
+    async def _ensure_browser(self) -> AsyncBrowser:
+        if self._browser is None or not self._browser.is_connected():
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=list(_CHROMIUM_LAUNCH_ARGS),
+            )
+        return self._browser
+
+    async def _pick_proxies(self, k: int) -> List[Dict]:
+        """Collect up to ``k`` distinct working proxies without blocking the loop."""
+        proxies: List[Dict] = []
+        seen = set()
+        for _ in range(k):
+            proxy = await asyncio.to_thread(self.proxy_manager.get_working_proxy, 3)
+            if not proxy:
+                break
+            key = GoogleMapsSessionManager._proxy_key(proxy)
+            if key in seen:
+                break
+            seen.add(key)
+            proxies.append(proxy)
+            self.proxy_manager.get_next_proxy()
+        return proxies
+
+    async def _race_proxies(self, target_url: str, k: int = 3) -> AsyncPage:
+        browser = await self._ensure_browser()
+        proxies = await self._pick_proxies(k)
+        if not proxies:
+            raise Exception("Unable to load target URL with available proxies")
+
+        self.logger.info("Racing %s proxies for %s", len(proxies), target_url)
+        tasks = {
+            asyncio.create_task(
+                asyncio.wait_for(self._attempt(browser, proxy, target_url), timeout=self.probe_timeout)
+            ): proxy
+            for proxy in proxies
+        }
+        pending = set(tasks)
+        winner = None
+        last_error: Optional[BaseException] = None
 
-        def on_response(response):
-            url = response.url
-            if "recaptcha" in url or "gstatic.com/recaptcha" in url:
-                self._recaptcha_detected = True
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    proxy = tasks[task]
+                    error = task.exception()
+                    if isinstance(error, asyncio.TimeoutError):
+                        # A slow proxy is not a blocked one; leave it in the rotation
+                        last_error = error
+                        self.logger.error(
+                            "Proxy %s timed out after %.1fs",
+                            GoogleMapsSessionManager._proxy_key(proxy),
+                            self.probe_timeout,
+                        )
+                        self.proxy_manager.record_failure(proxy)
+                        continue
+                    if error is not None:
+                        last_error = error
+                        self.logger.error(
+                            "Proxy %s failed: %s", GoogleMapsSessionManager._proxy_key(proxy), error
+                        )
+                        self.proxy_manager.record_failure(proxy, block=True)
+                        continue
+
+                    context, page = task.result()
+                    if winner is None:
+                        winner = (proxy, context, page)
+                    else:
+                        # Another proxy finished in the same tick; keep only one
+                        await context.close()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if winner is None:
+            raise last_error or Exception("Unable to load target URL with available proxies")
+
+        proxy, self._context, page = winner
+        self._current_proxy_info = proxy
+        self.proxy_manager.record_success(proxy)
+        self.logger.info("Proxy %s won the race: %s", GoogleMapsSessionManager._proxy_key(proxy), page.url)
+        return page
 
+    async def _attempt(self, browser: AsyncBrowser, proxy: Dict, target_url: str):
+        context = await browser.new_context(**_BASE_CONTEXT_KWARGS, proxy=_playwright_proxy_config(proxy))
         try:
-            page.on("response", on_response)
-        except Exception:
-            pass
+            page = await context.new_page()
+            await page.goto(target_url, wait_until="domcontentloaded", timeout=self.navigation_timeout)
+            if "consent.google.com" in page.url:
+                await self._handle_consent(page)
+            return context, page
+        except BaseException:
+            # Losing or failed attempts must not leak their context
+            try:
+                await context.close()
+            except Exception:
+                pass
+            raise
+
+    async def _handle_consent(self, page: AsyncPage):
+        try:
+            await page.locator(_CONSENT_ACCEPT_SELECTOR).first.wait_for(state="visible", timeout=5000)
+            for selector in _CONSENT_ACCEPT_SELECTORS:
+                button = page.locator(selector).first
+                if await button.is_visible():
+                    break
+            else:
+                button = page.locator(_CONSENT_ACCEPT_SELECTOR).first
+            await button.click()
+        except Exception as exc:
+            self.logger.debug("No consent button became visible: %s", exc)
+        await page.wait_for_url(lambda url: "consent.google.com" not in url, timeout=15000)
+
+    async def cleanup(self):
+        for context in self._pool_contexts.values():
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._pool_contexts.clear()
 
-    def cleanup(self):
         try:
             if self._context:
-                storage_state = self._context.storage_state()
-                storage_path = os.path.join(self.user_data_dir_path, "storage_state.json")
-                with open(storage_path, 'w') as fh:
-                    json.dump(storage_state, fh)
+                await self._context.close()
         except Exception:
             pass
+        finally:
+            self._context = None
 
         try:
             if self._browser:
-                self._browser.close()
+                await self._browser.close()
         except Exception:
             pass
         finally:
@@ -557,27 +1354,47 @@ class GoogleMapsSessionManager:
 
         try:
             if self._playwright:
-                self._playwright.stop()
+                await self._playwright.stop()
         except Exception:
             pass
         finally:
             self._playwright = None
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.cleanup()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.cleanup()
 
 
-def get_authenticated_page(headless: bool = False) -> Page:
-    manager = GoogleMapsSessionManager(headless=headless)
+def get_authenticated_page(headless: bool = False, persist_browser: bool = False) -> Page:
+    manager = GoogleMapsSessionManager(headless=headless, persist_browser=persist_browser)
     return manager.get_authenticated_page()
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
-    with GoogleMapsSessionManager() as manager:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Open an authenticated Google Maps session")
+    parser.add_argument(
+        "--persist-browser",
+        action="store_true",
+        help="Leave Chromium running (CDP on 127.0.0.1) so later runs can reconnect",
+    )
+    parser.add_argument(
+        "--stop-browser",
+        action="store_true",
+        help="Stop a Chromium left running by --persist-browser and exit",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if args.stop_browser:
+        stopped = stop_persistent_browser(Path(".gmaps_sessions") / "default")
+        print("Stopped persistent browser" if stopped else "No persistent browser running")
+        raise SystemExit(0)
+
+    with GoogleMapsSessionManager(persist_browser=args.persist_browser) as manager:
         page = manager.get_authenticated_page()
         print(f"Authenticated page URL: {page.url}")
         print(f"Page title: {page.title()}")
@@ -8,18 +8,197 @@ Specifically designed to scrape all brands from shopping centers and malls.
 Usage:
     from google_maps_scraper import GoogleMapsScraper
 
-    scraper = GoogleMapsScraper()
-    brands = scraper.scrape_brands_from_url("https://maps.app.goo.gl/FsGevWWrjvab4tZ9A")
+    with GoogleMapsScraper() as scraper:
+        brands = scraper.scrape_brands_from_url("https://maps.app.goo.gl/FsGevWWrjvab4tZ9A")
+        # Several URLs at once; safe to call after the sync scrape above
+        batches = scraper.scrape_brands_from_urls_sync(["https://maps.app.goo.gl/..."])
     print(f"Found {len(brands)} brands: {brands}")
 """
 
+import asyncio
 import json
+import os
+import re
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Set
 from urllib.parse import urlparse, parse_qs
 
-from playwright.sync_api import sync_playwright, Page, Browser, Playwright
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Playwright
+from playwright.async_api import async_playwright, Page as AsyncPage
+
+try:
+    import re2 as _regex_engine
+except ImportError:  # pragma: no cover - optional dependency
+    _regex_engine = re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import pw_patch
+except ImportError:  # pragma: no cover - run from legacy/ without the project root on sys.path
+    pw_patch = None
+
+if pw_patch:
+    # Opt-in: PW_INSPECT_STACK=0 drops Playwright's per-call stack capture
+    pw_patch.apply_from_env()
+
+
+_VIEW_ALL_SELECTOR = 'span:has-text("View all"), [aria-label="View all"], [jslog*="103597"]'
+_DIRECTORY_SELECTOR = '[role="feed"], div[aria-label*="Directory"]'
+
+# Elements whose text may be a brand name in the expanded directory
+_BRAND_ELEMENT_SELECTORS = (
+    '[role="button"]',
+    'button',
+    '[role="link"]',
+    'a[href*="place"]',
+    'div[role="button"]',
+    'span[role="button"]',
+)
+
+# Pre-accepted consent cookies so google.com skips the consent.google.com interstitial
+_CONSENT_COOKIES = [
+    {"name": "CONSENT", "value": "YES+", "domain": ".google.com", "path": "/"},
+    {
+        "name": "SOCS",
+        "value": "CAESHAgBEhJnd3NfMjAyMzA5MTMtMF9SQzIaAmVuIAEaBgiA_LyoBg",
+        "domain": ".google.com",
+        "path": "/",
+    },
+]
+
+# Subresources the text-only directory never needs; "maps/vt" serves map tiles
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+_MAP_TILE_PATH = "maps/vt"
+
+
+def _block_heavy_resources(route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _MAP_TILE_PATH in request.url:
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _block_heavy_resources_async(route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _MAP_TILE_PATH in request.url:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# One union selector visits each element once even when several selectors match it
+_BRAND_ELEMENT_UNION = ", ".join(_BRAND_ELEMENT_SELECTORS)
+
+_COLLECT_TEXTS_SCRIPT = """
+(elements) => [...new Set(
+    elements.map(el => (el.textContent || '').trim()).filter(Boolean)
+)]
+"""
+
+
+# UI and navigation text that is never a brand name
+_EXCLUDED_TEXTS = frozenset([
+    # Basic UI elements
+    'View all', 'More', 'Search', 'Directory', 'Back',
+
+    # Category headers
+    'Department stores', 'Food & Drink', 'Clothing', 'Shoes',
+    'Health & Beauty', 'Home & Kitchen', 'Jewellery', 'Electronics',
+    'Toys & Sports', 'Other',
+
+    # Navigation and actions
+    'Menu', 'Saved', 'Recents', 'Get app', 'Google apps', 'Sign in',
+    'Show Your Location', 'Zoom', 'Browse Street View', 'Street View',
+    'Layers', 'Collapse side panel',
+
+    # Business actions
+    'Directions', 'Save', 'Nearby', 'Send to phone', 'Share',
+    'See photos', 'Suggest an edit', 'Write a review', 'Call phone number',
+    'Copy address', 'Copy phone number', 'Copy website', 'Copy Plus Code',
+    'Reserve a table', 'Order online', 'Like',
+
+    # Information sections
+    'Popular times', 'Photos and videos', 'Add photos and videos',
+    'Questions and answers', 'More questions', 'Ask the community',
+    'Review summary', 'Updates from customers', 'People also search for',
+    'Web results', 'About this data',
+
+    # Status and metadata
+    'Open ⋅ Closes', 'Opens soon', 'Closes soon', 'Closed',
+    'Learn more', 'Show opening hours', 'Information about Popular Times',
+    'Local Guide', 'reviews', 'photos', 'New', 'a week ago', '3 weeks ago',
+    'a month ago', 'Photo of', 'Sundays', 'Go to the previous day',
+    'Go to the next day',
+
+    # Maps features
+    'Interactive map', '20 m', 'Browse Street View images',
+
+    # Consent page
+    'Reject all', 'Accept all', 'Language:', 'Privacy Policy',
+    'Terms of Service', 'Before you continue',
+
+    # Transport and services
+    'Restaurants', 'Hotels', 'Things to do', 'Transport', 'Parking',
+    'Chemists', 'ATMs', 'Next page'
+])
+
+# Private-use icon glyphs Google prefixes to non-brand controls
+_ICON_PREFIXES = (
+    '', '', '', '', '', '', '', '', '', '', '', '',
+    '', '', '', '', '', '', '', '', '', '', '', '',
+    '', '', '', '', '', '', '', '', '', '', '', ''
+)
+
+# google-re2 runs the filter as a linear-time DFA when installed; stdlib re otherwise
+_NON_BRAND_RE = _regex_engine.compile(
+    r"^(?:" + "|".join(map(_regex_engine.escape, _ICON_PREFIXES + ("",))) + r")|stars|^\d+$"
+)
+
+
+class NetworkIdleTracker:
+    """
+    Count in-flight requests on a page so callers can wait for a quiet window
+    instead of sleeping for a fixed time.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.inflight = 0
+        self.last_activity = time.monotonic()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    def _on_request(self, request) -> None:
+        self.inflight += 1
+        self.last_activity = time.monotonic()
+
+    def _on_request_done(self, request) -> None:
+        self.inflight = max(0, self.inflight - 1)
+        self.last_activity = time.monotonic()
+
+    def wait_idle(self, idle_ms: int = 500, timeout: int = 5000) -> bool:
+        """
+        Wait until no request has started or finished for ``idle_ms``.
+
+        Returns:
+            True once the page is idle, False if ``timeout`` elapsed first
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while time.monotonic() < deadline:
+            quiet_for = (time.monotonic() - self.last_activity) * 1000
+            if self.inflight == 0 and quiet_for >= idle_ms:
+                return True
+            # Short waits let the sync driver dispatch the request events above
+            self.page.wait_for_timeout(50)
+        return False
 
 
 class GoogleMapsScraper:
@@ -41,14 +220,9 @@ class GoogleMapsScraper:
         self.headless = headless
         self.timeout = timeout
         self.logger = logging.getLogger(__name__)
-
-        # Configure logging
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
 
     def scrape_brands_from_url(self, url: str) -> List[str]:
         """
@@ -62,35 +236,168 @@ class GoogleMapsScraper:
         """
         self.logger.info(f"Starting brand scrape for URL: {url}")
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
+        page = self._ensure_context().new_page()
+
+        try:
+            # Navigate to the URL and handle consent
+            brands = self._scrape_with_browser(page, url)
+            self.logger.info(f"Successfully scraped {len(brands)} brands")
+            return brands
+
+        except Exception as e:
+            self.logger.error(f"Error during scraping: {e}")
+            return []
+
+        finally:
+            page.close()
+
+    def _ensure_context(self) -> BrowserContext:
+        """Start Playwright, the browser and a reusable context on first use."""
+        if self._context is None:
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=self.headless)
+            self._context = self._browser.new_context()
+            self._context.add_cookies(_CONSENT_COOKIES)
+            self._context.route("**/*", _block_heavy_resources)
+        return self._context
+
+    def close(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        try:
+            if self._browser:
+                self._browser.close()
+        finally:
+            if self._pw:
+                self._pw.stop()
+            self._pw = None
+            self._browser = None
+            self._context = None
+
+    def __enter__(self):
+        # Sync Playwright starts on the first scrape_brands_from_url call; starting it
+        # here would leave its event loop running and break asyncio.run() in the block
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def scrape_brands_from_urls(self, urls: List[str], max_concurrency: int = 5) -> List[List[str]]:
+        """
+        Scrape several Google Maps URLs concurrently from a pool of browser contexts.
+
+        Args:
+            urls: Google Maps URLs to scrape
+            max_concurrency: Maximum number of pages loading at the same time
+
+        Returns:
+            One brand list per URL, in input order (empty when a URL failed)
+        """
+        self.logger.info(f"Starting brand scrape for {len(urls)} URLs")
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            # Warm contexts are handed out per scrape; the semaphore still caps open pages
+            context_pool: asyncio.Queue = asyncio.Queue()
+            for _ in range(max(1, min(max_concurrency, os.cpu_count() or 1, len(urls)))):
+                context = await browser.new_context()
+                await context.add_cookies(_CONSENT_COOKIES)
+                await context.route("**/*", _block_heavy_resources_async)
+                context_pool.put_nowait(context)
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def worker(url: str) -> List[str]:
+                async with semaphore:
+                    context = await context_pool.get()
+                    try:
+                        page = await context.new_page()
+                        try:
+                            brands = await self._scrape_with_browser_async(page, url)
+                            self.logger.info(f"Successfully scraped {len(brands)} brands from {url}")
+                            return brands
+                        finally:
+                            try:
+                                await page.close()
+                            except Exception as exc:
+                                self.logger.debug(f"Could not close page for {url}: {exc}")
+                    finally:
+                        # Always hand the context back, or the other workers wait on the pool forever
+                        context_pool.put_nowait(context)
 
             try:
-                # Navigate to the URL and handle consent
-                brands = self._scrape_with_browser(page, url)
-                self.logger.info(f"Successfully scraped {len(brands)} brands")
-                return brands
+                results = await asyncio.gather(*(worker(url) for url in urls), return_exceptions=True)
+            finally:
+                await browser.close()
+
+        brand_lists: List[List[str]] = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error during scraping {url}: {result}")
+                brand_lists.append([])
+            else:
+                brand_lists.append(result)
+        return brand_lists
+
+    def scrape_brands_from_urls_sync(self, urls: List[str], max_concurrency: int = 5) -> List[List[str]]:
+        """
+        Run ``scrape_brands_from_urls`` to completion from synchronous code.
+
+        The batch gets its own thread and event loop, so it also works after
+        ``scrape_brands_from_url`` has started sync Playwright in this thread,
+        where ``asyncio.run()`` would refuse to start.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.scrape_brands_from_urls(urls, max_concurrency)).result()
+
+    async def _scrape_with_browser_async(self, page: AsyncPage, url: str) -> List[str]:
+        """Async counterpart of ``_scrape_with_browser`` used by ``scrape_brands_from_urls``."""
 
+        await page.goto(url, wait_until='domcontentloaded')
+
+        if 'consent.google.com' in page.url:
+            self.logger.info("Handling Google consent page...")
+            try:
+                await page.locator(
+                    'button:has-text("Accept all"), [aria-label*="Accept"], button[data-value="accept"]'
+                ).first.click(timeout=self.timeout)
+                await page.wait_for_url(lambda current: 'consent.google.com' not in current, timeout=self.timeout)
             except Exception as e:
-                self.logger.error(f"Error during scraping: {e}")
-                return []
+                self.logger.warning(f"Could not automatically accept consent: {e}")
 
-            finally:
-                browser.close()
+        self.logger.info(f"Successfully loaded Maps page: {page.url}")
+
+        try:
+            # click() waits for the button to render, so no fixed settle time is needed
+            await page.locator(_VIEW_ALL_SELECTOR).first.click(timeout=self.timeout)
+            await page.wait_for_selector(_DIRECTORY_SELECTOR, state="visible", timeout=self.timeout)
+        except Exception as e:
+            self.logger.warning(f"Could not click View all button: {e}")
+            return []
+
+        try:
+            texts = await page.locator(_BRAND_ELEMENT_UNION).evaluate_all(_COLLECT_TEXTS_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"Error collecting element texts: {e}")
+            texts = []
+
+        return sorted({text for text in texts if self._is_brand_name(text)})
 
     def _scrape_with_browser(self, page: Page, url: str) -> List[str]:
         """Internal method to handle the scraping logic with an open browser page."""
 
+        network = NetworkIdleTracker(page)
+
         # Navigate to the URL
         page.goto(url, wait_until='domcontentloaded')
 
         # Handle Google consent page if redirected
         self._handle_consent_page(page)
 
-        # Wait for Maps page to load
-        page.wait_for_load_state('networkidle')
-        page.wait_for_timeout(3000)  # Extra time for dynamic content
+        # Wait for Maps to go quiet and render the directory entry point
+        network.wait_idle()
+        try:
+            page.wait_for_selector(_VIEW_ALL_SELECTOR, state="visible", timeout=self.timeout)
+        except Exception as e:
+            self.logger.debug(f"View all button not visible yet: {e}")
 
         self.logger.info(f"Successfully loaded Maps page: {page.url}")
 
@@ -98,6 +405,7 @@ class GoogleMapsScraper:
         if not self._click_view_all_button(page):
             self.logger.warning("Could not click View all button")
             return []
+        network.wait_idle()
 
         # Extract brands from the directory
         brands = self._extract_brands_from_page(page)
@@ -132,10 +440,9 @@ class GoogleMapsScraper:
         for strategy in accept_strategies:
             try:
                 strategy()
-                page.wait_for_timeout(2000)
-                if 'consent.google.com' not in page.url:
-                    self.logger.info("Successfully accepted consent")
-                    return
+                page.wait_for_url(lambda current: 'consent.google.com' not in current, timeout=2000)
+                self.logger.info("Successfully accepted consent")
+                return
             except Exception as e:
                 self.logger.debug(f"Consent strategy failed: {e}")
                 continue
@@ -147,65 +454,29 @@ class GoogleMapsScraper:
 
         self.logger.info("Looking for View all button...")
 
-        # Multiple strategies to find and click View all
-        click_strategies = [
-            # Strategy 1: Direct span text
-            lambda: page.locator('span:has-text("View all")').first.click(),
-
-            # Strategy 2: ARIA label
-            lambda: page.locator('[aria-label="View all"]').first.click(),
-
-            # Strategy 3: jslog attribute (analytics tracking)
-            lambda: page.locator('[jslog*="103597"]').first.click(),
-
-            # Strategy 4: Find clickable parent of View all text
-            lambda: page.locator('xpath=//span[contains(text(), "View all")]/ancestor::button').first.click(),
-            lambda: page.locator('xpath=//span[contains(text(), "View all")]/ancestor::div[@role="button"]').first.click(),
-            lambda: page.locator('xpath=//span[contains(text(), "View all")]/ancestor::a').first.click(),
-        ]
-
-        for i, strategy in enumerate(click_strategies):
-            try:
-                strategy()
-                page.wait_for_timeout(2000)  # Wait for directory to load
-                self.logger.info(f"Successfully clicked View all button (strategy {i+1})")
-                return True
-            except Exception as e:
-                self.logger.debug(f"View all click strategy {i+1} failed: {e}")
-                continue
-
-        return False
+        # One compound selector: the engine resolves whichever variant renders first
+        try:
+            page.locator(_VIEW_ALL_SELECTOR).first.click(timeout=5000)
+            page.wait_for_selector(_DIRECTORY_SELECTOR, state="visible", timeout=self.timeout)
+            self.logger.info("Successfully clicked View all button")
+            return True
+        except Exception as e:
+            self.logger.debug(f"View all click failed: {e}")
+            return False
 
     def _extract_brands_from_page(self, page: Page) -> List[str]:
         """Extract brand/store names from the loaded directory page."""
 
         self.logger.info("Extracting brands from page...")
 
-        brands: Set[str] = set()
+        try:
+            # One round-trip returns every candidate text, already de-duplicated
+            texts = page.locator(_BRAND_ELEMENT_UNION).evaluate_all(_COLLECT_TEXTS_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"Error collecting element texts: {e}")
+            texts = []
 
-        # Multiple selectors to find brand elements
-        selectors = [
-            '[role="button"]',
-            'button',
-            '[role="link"]',
-            'a[href*="place"]',
-            'div[role="button"]',
-            'span[role="button"]'
-        ]
-
-        for selector in selectors:
-            try:
-                elements = page.locator(selector).all()
-                for element in elements:
-                    try:
-                        text = element.text_content().strip()
-                        if self._is_brand_name(text):
-                            brands.add(text)
-                    except:
-                        continue
-            except Exception as e:
-                self.logger.debug(f"Error with selector {selector}: {e}")
-                continue
+        brands: Set[str] = {text for text in texts if self._is_brand_name(text)}
 
         brand_list = sorted(list(brands))
         self.logger.info(f"Extracted {len(brand_list)} unique brands")
@@ -219,73 +490,14 @@ class GoogleMapsScraper:
         non-brand text that commonly appears on Google Maps pages.
         """
 
-        if not text or len(text) < 3:
-            return False
-
-        # Common UI and navigation text to exclude
-        exclude_patterns = [
-            # Basic UI elements
-            'View all', 'More', 'Search', 'Directory', 'Back',
-
-            # Category headers
-            'Department stores', 'Food & Drink', 'Clothing', 'Shoes',
-            'Health & Beauty', 'Home & Kitchen', 'Jewellery', 'Electronics',
-            'Toys & Sports', 'Other',
-
-            # Navigation and actions
-            'Menu', 'Saved', 'Recents', 'Get app', 'Google apps', 'Sign in',
-            'Show Your Location', 'Zoom', 'Browse Street View', 'Street View',
-            'Layers', 'Collapse side panel',
-
-            # Business actions
-            'Directions', 'Save', 'Nearby', 'Send to phone', 'Share',
-            'See photos', 'Suggest an edit', 'Write a review', 'Call phone number',
-            'Copy address', 'Copy phone number', 'Copy website', 'Copy Plus Code',
-            'Reserve a table', 'Order online', 'Like',
-
-            # Information sections
-            'Popular times', 'Photos and videos', 'Add photos and videos',
-            'Questions and answers', 'More questions', 'Ask the community',
-            'Review summary', 'Updates from customers', 'People also search for',
-            'Web results', 'About this data',
-
-            # Status and metadata
-            'Open ⋅ Closes', 'Opens soon', 'Closes soon', 'Closed',
-            'Learn more', 'Show opening hours', 'Information about Popular Times',
-            'Local Guide', 'reviews', 'photos', 'New', 'a week ago', '3 weeks ago',
-            'a month ago', 'Photo of', 'Sundays', 'Go to the previous day',
-            'Go to the next day',
-
-            # Maps features
-            'Interactive map', '20 m', 'Browse Street View images',
-
-            # Consent page
-            'Reject all', 'Accept all', 'Language:', 'Privacy Policy',
-            'Terms of Service', 'Before you continue',
-
-            # Transport and services
-            'Restaurants', 'Hotels', 'Things to do', 'Transport', 'Parking',
-            'Chemists', 'ATMs', 'Next page'
-        ]
-
-        if text in exclude_patterns:
-            return False
-
-        # Filter out icon-only elements (starting with special Unicode characters)
-        icon_prefixes = [
-            '', '', '', '', '', '', '', '', '', '', '', '',
-            '', '', '', '', '', '', '', '', '', '', '', '',
-            '', '', '', '', '', '', '', '', '', '', '', ''
-        ]
-
-        if any(text.startswith(prefix) for prefix in icon_prefixes):
-            return False
-
-        # Additional filters for numbers and ratings
-        if text.isdigit() or 'stars' in text or text.startswith(''):
-            return False
-
-        return True
+        # Exact UI labels are a set lookup; icon glyphs, pure numbers and star
+        # ratings share one precompiled pattern
+        return (
+            bool(text)
+            and len(text) >= 3
+            and text not in _EXCLUDED_TEXTS
+            and not _NON_BRAND_RE.search(text)
+        )
 
     def save_results(self, brands: List[str], url: str, filename: Optional[str] = None) -> str:
         """
@@ -325,8 +537,12 @@ class GoogleMapsScraper:
             'notes': 'Scraped using automated browser with consent handling and View all button clicking'
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if orjson:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
 
         self.logger.info(f"Results saved to {filename}")
         return filename
@@ -346,19 +562,17 @@ def main():
     args = parser.parse_args()
 
     # Configure logging
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        logging.basicConfig(level=logging.INFO)
-
-    # Create scraper
-    scraper = GoogleMapsScraper(headless=not args.headed)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
 
-    # Scrape brands
-    brands = scraper.scrape_brands_from_url(args.url)
+    # Create scraper and scrape brands
+    with GoogleMapsScraper(headless=not args.headed) as scraper:
+        brands = scraper.scrape_brands_from_url(args.url)
 
-    # Save results
-    filename = scraper.save_results(brands, args.url, args.output)
+        # Save results
+        filename = scraper.save_results(brands, args.url, args.output)
 
     # Print summary
     print(f"\nScraping completed!")
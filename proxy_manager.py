@@ -7,13 +7,20 @@ Includes automatic integration with the Webshare proxy API when credentials
 are available via environment variables.
 """
 
+import atexit
 import hashlib
 import json
 import logging
 import os
 import random
+import sqlite3
+import sys
+import threading
 import time
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -30,8 +37,15 @@ _MODULE_DIR = Path(__file__).resolve().parent
 _PARENT_DIR = _MODULE_DIR.parent
 
 
+_ENV_LOADED = False
+
+
 def _load_env():
-    """Load environment variables from common .env locations."""
+    """Load environment variables from common .env locations, once per process."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     for candidate in (
         _MODULE_DIR / ".env",
         _PARENT_DIR / ".env",
@@ -43,12 +57,31 @@ def _load_env():
 
 _load_env()
 
-from dotenv import load_dotenv
 
-load_dotenv()
+# Weight of the newest sample in each proxy's smoothed latency
+_LATENCY_EWMA_ALPHA = 0.3
+
+# Dirty proxy stats are written out once this many accumulate, or after this long
+_FLUSH_BATCH_SIZE = 32
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Managers not yet closed; held weakly so the exit hook never keeps one alive
+_OPEN_MANAGERS: "weakref.WeakSet[ProxyManager]" = weakref.WeakSet()
+
+
+def _flush_open_managers() -> None:
+    for manager in list(_OPEN_MANAGERS):
+        manager._flush_all()
+
+
+atexit.register(_flush_open_managers)
 
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ where the runtime supports them
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProxyStats:
     uses: int = 0
     success: int = 0
@@ -59,8 +92,16 @@ class ProxyStats:
     last_failure: float = 0.0
     last_block: float = 0.0
     last_health_check: float = 0.0
+    last_latency: float = 0.0
+    ewma_latency: float = 0.0
     healthy: bool = True
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _PROXY_STATS_FIELDS}
+
+
+_PROXY_STATS_FIELDS = tuple(field.name for field in fields(ProxyStats))
+
 
 class ProxyManager:
     """Manages residential proxy rotation for anti-detection."""
@@ -73,23 +114,41 @@ class ProxyManager:
         health_check_url: Optional[str] = None,
         storage_dir: Optional[str] = None,
         recheck_interval: Optional[int] = None,
+        quarantine_period: int = 300,
     ):
         """Initialize proxy manager.
 
         Args:
             proxy_list: List of proxy strings in format 'IP:PORT:USERNAME:PASSWORD'
+            quarantine_period: Seconds a blocked proxy is kept out of rotation
         """
         self.proxies: List[Dict[str, any]] = []
-        self.current_index = 0
+        # Rotation order; the head is the current proxy. Blocked proxies sit in
+        # the quarantine with their release time until _reclaim() returns them.
+        self._healthy: deque = deque()
+        self._quarantine: deque = deque()
+        self.quarantine_period = quarantine_period
         self.last_rotation = time.time()
         self.cooldown_period = cooldown_period  # seconds between rotations
         self.health_check_url = health_check_url or os.getenv(
             "WEBSHARE_HEALTH_CHECK_URL",
-            "https://ipv4.webshare.io/",
+            # Empty 204 body: confirms the proxy reaches Google without a payload
+            "https://www.google.com/generate_204",
         )
         self.recheck_interval = recheck_interval or int(os.getenv("WEBSHARE_RECHECK_INTERVAL", "300"))
         self.storage_dir = Path(storage_dir or ".proxy_state")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._db_lock = threading.Lock()
+        self._db = self._open_state_db(self.storage_dir / "proxy_state.sqlite")
+        # Stats changes are buffered here by slug and written in batches
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._last_flush = time.monotonic()
+        # One keep-alive HTTP session per thread (requests.Session is not
+        # thread-safe), created on first use and tracked so close() can release them
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+        self._sessions_lock = threading.Lock()
+        _OPEN_MANAGERS.add(self)
 
         if proxy_list:
             self.load_proxies(proxy_list)
@@ -103,15 +162,70 @@ class ProxyManager:
                 if proxy_info:
                     proxy_info.setdefault("stats", ProxyStats())
                     proxy_info.setdefault("slug", self._slug_for_proxy(proxy_info))
-                    proxy_info["storage_path"] = self.storage_dir / proxy_info["slug"]
-                    proxy_info["storage_path"].mkdir(parents=True, exist_ok=True)
                     self._load_proxy_state(proxy_info)
                     self.proxies.append(proxy_info)
 
         # Shuffle for random initial order
         random.shuffle(self.proxies)
+        self._healthy = deque(self.proxies)
+        self._quarantine = deque()
         self.last_rotation = time.time()
 
+    @property
+    def current_index(self) -> int:
+        """Position of the current proxy in ``self.proxies``."""
+        if not self._healthy:
+            return 0
+        head = self._healthy[0]
+        return next(i for i, proxy in enumerate(self.proxies) if proxy is head)
+
+    def sorted_by_latency(self, *, max_latency: Optional[float] = None) -> List[Dict[str, any]]:
+        """Return proxies ordered by smoothed health-check latency, fastest first.
+
+        Never-measured proxies come last.
+
+        Args:
+            max_latency: Leave out proxies whose smoothed latency exceeds this many seconds
+        """
+        measured = sorted(
+            (proxy for proxy in self.proxies if proxy["stats"].ewma_latency),
+            key=lambda proxy: proxy["stats"].ewma_latency,
+        )
+        if max_latency is not None:
+            measured = [proxy for proxy in measured if proxy["stats"].ewma_latency <= max_latency]
+        unknown = [proxy for proxy in self.proxies if not proxy["stats"].ewma_latency]
+        return measured + unknown
+
+    def prefer_fastest(self, max_latency: float = 5.0) -> None:
+        """Reorder the rotation so the fastest known proxies are tried first.
+
+        Proxies slower than ``max_latency`` move to the back rather than out of
+        the rotation, so a slow pool still yields a proxy.
+        """
+        active = {id(proxy) for proxy in self._healthy}
+        ordered = [proxy for proxy in self.sorted_by_latency(max_latency=max_latency) if id(proxy) in active]
+        ranked = {id(proxy) for proxy in ordered}
+        ordered.extend(proxy for proxy in self._healthy if id(proxy) not in ranked)
+        self._healthy = deque(ordered)
+
+    def _reclaim(self) -> None:
+        """Return proxies whose quarantine has expired to the back of the rotation."""
+        now = time.time()
+        while self._quarantine and self._quarantine[0][0] <= now:
+            self._healthy.append(self._quarantine.popleft()[1])
+        if not self._healthy and self._quarantine:
+            # Never leave the rotation empty; release the longest-held proxy early
+            self._healthy.append(self._quarantine.popleft()[1])
+
+    def _quarantine_proxy(self, proxy: Dict[str, any]) -> None:
+        if self._healthy and self._healthy[0] is proxy:
+            self._healthy.popleft()
+        elif proxy in self._healthy:
+            self._healthy.remove(proxy)
+        else:
+            return
+        self._quarantine.append((time.time() + self.quarantine_period, proxy))
+
     def _parse_proxy_string(self, proxy_str: str) -> Optional[Dict[str, str]]:
         """Parse proxy string into components.
 
@@ -130,44 +244,102 @@ class ProxyManager:
             except Exception:
                 return None
 
+            proxy_url = f"http://{username}:{password}@{ip}:{port}"
             return {
                 "ip": ip,
                 "port": port,
                 "username": username,
                 "password": password,
-                "proxy_url": f"http://{username}:{password}@{ip}:{port}",
-                "https_url": f"http://{username}:{password}@{ip}:{port}",
+                "proxy_url": proxy_url,
+                "https_url": proxy_url,
+                # Built once so request paths can pass it straight to requests
+                "requests_proxies": {"http": proxy_url, "https": proxy_url},
             }
         except Exception:
             return None
 
     def _slug_for_proxy(self, proxy_info: Dict[str, str]) -> str:
+        base = f"{proxy_info['ip']}:{proxy_info['port']}:{proxy_info['username']}"
+        digest = hashlib.blake2b(base.encode("utf-8"), digest_size=6).hexdigest()
+        safe_ip = proxy_info["ip"].replace(".", "-").replace(":", "-")
+        return f"{safe_ip[:20]}-{digest}"
+
+    def _legacy_slug_for_proxy(self, proxy_info: Dict[str, str]) -> str:
+        """Slug used before the switch to BLAKE2b, kept to find older saved stats."""
         base = f"{proxy_info['ip']}:{proxy_info['port']}:{proxy_info['username']}"
         digest = hashlib.sha1(base.encode("utf-8")).hexdigest()[:12]
         safe_ip = proxy_info["ip"].replace(".", "-").replace(":", "-")
         return f"{safe_ip[:20]}-{digest}"
 
-    def _load_proxy_state(self, proxy_info: Dict[str, any]) -> None:
-        stats_path = proxy_info["storage_path"] / "stats.json"
-        if stats_path.exists():
-            try:
-                data = json.loads(stats_path.read_text())
-                proxy_info["stats"] = ProxyStats(**data)
-            except Exception:
-                pass
+    @staticmethod
+    def _open_state_db(db_path: Path) -> sqlite3.Connection:
+        db = sqlite3.connect(db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS proxy_stats (slug TEXT PRIMARY KEY, json TEXT)")
+        db.commit()
+        return db
 
-    def _save_proxy_state(self, proxy_info: Dict[str, any]) -> None:
-        stats_path = proxy_info["storage_path"] / "stats.json"
+    def _load_proxy_state(self, proxy_info: Dict[str, any]) -> None:
+        row = self._select_stats(proxy_info["slug"])
+        if row is None and "ip" in proxy_info:
+            # Stats saved under the old SHA-1 slug, either in the database or
+            # in the per-proxy directories that predate it
+            legacy_slug = self._legacy_slug_for_proxy(proxy_info)
+            row = self._select_stats(legacy_slug)
+            legacy_path = self.storage_dir / legacy_slug / "stats.json"
+            if row is None and legacy_path.exists():
+                row = (legacy_path.read_text(),)
+            if row is not None:
+                self._save_proxy_state(proxy_info)
+        if row is None:
+            return
         try:
-            stats_path.write_text(json.dumps(proxy_info["stats"].__dict__, indent=2))
+            proxy_info["stats"] = ProxyStats(**json.loads(row[0]))
         except Exception:
             pass
 
+    def _select_stats(self, slug: str) -> Optional[tuple]:
+        with self._db_lock:
+            return self._db.execute(
+                "SELECT json FROM proxy_stats WHERE slug = ?", (slug,)
+            ).fetchone()
+
+    def _save_proxy_state(self, proxy_info: Dict[str, any]) -> None:
+        """Mark a proxy's stats dirty; they reach disk on the next flush."""
+        self._dirty[proxy_info["slug"]] = proxy_info
+
+    def _maybe_flush(self) -> None:
+        if not self._dirty:
+            return
+        if (
+            len(self._dirty) >= _FLUSH_BATCH_SIZE
+            or time.monotonic() - self._last_flush > _FLUSH_INTERVAL_SECONDS
+        ):
+            self._flush_all()
+
+    def _flush_all(self) -> None:
+        """Write every dirty proxy's stats to the state database."""
+        dirty, self._dirty = self._dirty, {}
+        rows = [(slug, json.dumps(proxy_info["stats"].to_dict())) for slug, proxy_info in dirty.items()]
+        if rows:
+            try:
+                with self._db_lock, self._db:
+                    self._db.executemany(
+                        "INSERT INTO proxy_stats (slug, json) VALUES (?, ?) "
+                        "ON CONFLICT(slug) DO UPDATE SET json = excluded.json",
+                        rows,
+                    )
+            except sqlite3.Error as exc:
+                logging.debug(f"Could not save proxy stats: {exc}")
+        self._last_flush = time.monotonic()
+
     def get_current_proxy(self) -> Optional[Dict[str, str]]:
         """Get current proxy configuration."""
-        if not self.proxies:
+        self._reclaim()
+        if not self._healthy:
             return None
-        proxy = self.proxies[self.current_index]
+        proxy = self._healthy[0]
         stats: ProxyStats = proxy["stats"]
         stats.last_use = time.time()
         stats.uses += 1
@@ -176,15 +348,17 @@ class ProxyManager:
 
     def get_next_proxy(self) -> Optional[Dict[str, str]]:
         """Get next proxy in rotation."""
-        if not self.proxies:
+        self._reclaim()
+        if not self._healthy:
             return None
 
-        self.current_index = (self.current_index + 1) % len(self.proxies)
+        self._healthy.rotate(-1)
         self.last_rotation = time.time()
-        next_proxy = self.proxies[self.current_index]
+        next_proxy = self._healthy[0]
         stats: ProxyStats = next_proxy["stats"]
         stats.last_use = self.last_rotation
         self._save_proxy_state(next_proxy)
+        self._maybe_flush()
         return next_proxy
 
     def rotate_on_rate_limit(
@@ -198,6 +372,10 @@ class ProxyManager:
         Returns:
             New proxy configuration
         """
+        self._rate_limit_backoff(backoff_seconds)
+        return self.get_next_proxy()
+
+    def _rate_limit_backoff(self, backoff_seconds: int) -> None:
         # Add cooldown to prevent rapid rotations
         elapsed = time.time() - self.last_rotation
         if elapsed < self.cooldown_period:
@@ -208,15 +386,13 @@ class ProxyManager:
         backoff = backoff_seconds + random.uniform(0, 5)
         time.sleep(backoff)
 
-        return self.get_next_proxy()
-
     def get_proxy_for_requests(self) -> Optional[Dict[str, str]]:
         """Get proxy configuration formatted for requests library."""
         proxy = self.get_current_proxy()
         if not proxy:
             return None
 
-        return {"http": proxy["proxy_url"], "https": proxy["https_url"]}
+        return proxy["requests_proxies"]
 
     def record_success(self, proxy: Dict[str, any]) -> None:
         stats: ProxyStats = proxy["stats"]
@@ -232,21 +408,34 @@ class ProxyManager:
         if block:
             stats.blocks += 1
             stats.last_block = stats.last_failure
+            self._quarantine_proxy(proxy)
         stats.healthy = False
         self._save_proxy_state(proxy)
 
     def mark_rate_limit(self, backoff_seconds: int = 10) -> Optional[Dict[str, str]]:
         proxy = self.get_current_proxy()
         if proxy:
+            # Quarantining already moves the rotation on; rotating again would skip a proxy
             self.record_failure(proxy, block=True)
-        return self.rotate_on_rate_limit(backoff_seconds)
+        self._rate_limit_backoff(backoff_seconds)
+        self.last_rotation = time.time()
+        return self.get_current_proxy()
 
-    def test_proxy(self, proxy_info: Dict[str, str], timeout: int = 10) -> bool:
+    def test_proxy(
+        self,
+        proxy_info: Dict[str, str],
+        timeout: int = 10,
+        *,
+        connect_timeout: float = 3,
+        session=None,
+    ) -> bool:
         """Test if a proxy is working.
 
         Args:
             proxy_info: Proxy configuration
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds once connected
+            connect_timeout: Seconds allowed to reach the proxy, so dead ones fail fast
+            session: requests session to send the probe on (default: this thread's pooled one)
 
         Returns:
             True if proxy works, False otherwise
@@ -258,21 +447,23 @@ class ProxyManager:
             return True  # Can't test without requests
 
         try:
-            proxies = {
-                "http": proxy_info["proxy_url"],
-                "https": proxy_info["https_url"],
-            }
-
-            response = requests.get(
+            started = time.monotonic()
+            response = (session or self._http_session()).get(
                 self.health_check_url,
-                proxies=proxies,
-                timeout=timeout,
+                proxies=proxy_info["requests_proxies"],
+                timeout=(min(connect_timeout, timeout), timeout),
                 headers={"User-Agent": "Mozilla/5.0 (compatible; ProxyTest/1.0)"},
             )
 
-            healthy = response.status_code == 200
+            healthy = response.status_code in (200, 204)
             stats: ProxyStats = proxy_info["stats"]
             stats.last_health_check = time.time()
+            stats.last_latency = time.monotonic() - started
+            stats.ewma_latency = (
+                _LATENCY_EWMA_ALPHA * stats.last_latency + (1 - _LATENCY_EWMA_ALPHA) * stats.ewma_latency
+                if stats.ewma_latency
+                else stats.last_latency
+            )
             stats.healthy = healthy
             if healthy:
                 stats.last_success = stats.last_health_check
@@ -290,25 +481,88 @@ class ProxyManager:
             self._save_proxy_state(proxy_info)
             return False
 
+    def _http_session(self):
+        """This thread's pooled requests session, so repeated health checks reuse connections."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Flush pending stats and release the HTTP sessions and state database."""
+        _OPEN_MANAGERS.discard(self)
+        self._flush_all()
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+        with self._db_lock:
+            self._db.close()
+
+    def health_check_all(
+        self,
+        concurrency: int = 20,
+        *,
+        force: bool = False,
+        stop_after: Optional[int] = None,
+    ) -> int:
+        """Concurrently re-test every proxy whose last check is older than recheck_interval.
+
+        Results persist across runs, so a warm start skips recently checked
+        proxies; ``force`` re-tests all of them regardless. With ``stop_after``,
+        checks that have not started yet are cancelled once that many proxies
+        have come back healthy.
+
+        Returns:
+            Number of proxies that were tested
+        """
+        now = time.time()
+        stale = [
+            proxy for proxy in self.proxies
+            if force or (now - proxy["stats"].last_health_check) > self.recheck_interval
+        ]
+        if not stale:
+            return 0
+
+        healthy = 0
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(stale))) as pool:
+            futures = [pool.submit(self.test_proxy, proxy) for proxy in stale]
+            for future in as_completed(futures):
+                if future.result():
+                    healthy += 1
+                if stop_after is not None and healthy >= stop_after:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        # Persist the results now so the next process can skip fresh checks
+        self._flush_all()
+        return sum(1 for future in futures if not future.cancelled())
+
     def get_working_proxy(self, max_attempts: int = 3) -> Optional[Dict[str, str]]:
-        """Get a working proxy, testing up to max_attempts proxies.
+        """Get a working proxy, checking up to max_attempts proxies.
+
+        Stale proxies are health-checked concurrently first, so picking one
+        only reads the results.
 
         Args:
-            max_attempts: Maximum number of proxies to test
+            max_attempts: Maximum number of proxies to check
 
         Returns:
             Working proxy configuration, or None if none work
         """
-        for _ in range(min(max_attempts, len(self.proxies))):
-            proxy = self.get_current_proxy()
-            if not proxy:
-                break
+        self.health_check_all()
+        self._reclaim()
 
-            if (time.time() - proxy["stats"].last_health_check) > self.recheck_interval:
-                self.test_proxy(proxy)
-
-            if proxy["stats"].healthy and self.test_proxy(proxy):
-                return proxy
+        for _ in range(min(max_attempts, len(self._healthy))):
+            if self._healthy[0]["stats"].healthy:
+                return self.get_current_proxy()
 
             # Try next proxy
             self.get_next_proxy()
@@ -329,6 +583,8 @@ class ProxyManager:
                 "failures": stats.failures,
                 "blocks": stats.blocks,
                 "healthy": stats.healthy,
+                "latency": stats.last_latency or None,
+                "ewma_latency": stats.ewma_latency or None,
                 "seconds_since_use": now - stats.last_use if stats.last_use else None,
                 "seconds_since_health_check": now - stats.last_health_check if stats.last_health_check else None,
             })
@@ -345,8 +601,50 @@ class ProxyManager:
 # Default proxy list from Webshare credentials (deprecated fallback)
 DEFAULT_WEBHARE_PROXIES: List[str] = []
 
+# Seconds a fetched Webshare proxy list is reused from disk before refetching.
+# The cache holds full ip:port:user:password entries, so it is written owner-only.
+WEBSHARE_CACHE_TTL = int(os.getenv("WEBSHARE_CACHE_TTL", "3600"))
+
 
-def _fetch_webshare_proxies(api_key: str, *, limit: int = 50) -> List[str]:
+def _webshare_cache_path(storage_dir: Path, url: str, params: Dict[str, Any], api_key: str) -> Path:
+    # Keyed by account too, so a new WEBSHARE_API_KEY never reads the old account's list
+    account = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+    key = json.dumps({"url": url, "params": params, "account": account}, sort_keys=True).encode("utf-8")
+    return storage_dir / f"webshare_{hashlib.blake2b(key, digest_size=6).hexdigest()}.json"
+
+
+def _read_webshare_cache(cache_path: Path) -> Optional[List[str]]:
+    try:
+        if time.time() - cache_path.stat().st_mtime > WEBSHARE_CACHE_TTL:
+            return None
+        proxies = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(proxies, list) or not proxies:
+        return None
+    return proxies
+
+
+def _write_webshare_cache(cache_path: Path, proxies: List[str]) -> None:
+    """Atomically cache the proxy list; owner-only (0o600) since entries carry passwords."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as fh:
+            fh.write(json.dumps(proxies))
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logging.debug(f"Could not cache Webshare proxy list: {exc}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _fetch_webshare_proxies(
+    api_key: str,
+    *,
+    limit: int = 50,
+    storage_dir: Optional[Path] = None,
+) -> List[str]:
     if not requests:
         raise RuntimeError("requests is required to fetch Webshare proxies")
 
@@ -364,6 +662,12 @@ def _fetch_webshare_proxies(api_key: str, *, limit: int = 50) -> List[str]:
     if country_codes:
         params["country_codes"] = country_codes
 
+    cache_path = _webshare_cache_path(storage_dir, url, params, api_key) if storage_dir else None
+    if cache_path:
+        cached = _read_webshare_cache(cache_path)
+        if cached:
+            return cached
+
     response = requests.get(
         url,
         headers={"Authorization": f"Token {api_key}"},
@@ -382,6 +686,9 @@ def _fetch_webshare_proxies(api_key: str, *, limit: int = 50) -> List[str]:
         if all((proxy_address, port, username, password)):
             proxies.append(f"{proxy_address}:{port}:{username}:{password}")
 
+    if cache_path and proxies:
+        _write_webshare_cache(cache_path, proxies)
+
     return proxies
 
 
@@ -389,10 +696,11 @@ def create_default_proxy_manager() -> ProxyManager:
     """Create proxy manager populated with Webshare proxies when possible."""
     api_key = os.getenv("WEBSHARE_API_KEY")
     proxies: List[str] = []
+    manager = ProxyManager()
 
     if api_key:
         try:
-            proxies = _fetch_webshare_proxies(api_key)
+            proxies = _fetch_webshare_proxies(api_key, storage_dir=manager.storage_dir)
         except Exception as exc:
             logging.warning(f"Failed to fetch Webshare proxies via API: {exc}")
 
@@ -400,9 +708,10 @@ def create_default_proxy_manager() -> ProxyManager:
         proxies = DEFAULT_WEBHARE_PROXIES
         logging.info("Falling back to bundled default Webshare proxies")
 
-    manager = ProxyManager()
     if proxies:
         manager.load_proxies(proxies)
+        # Latency history persists across runs; start from the fastest known proxy
+        manager.prefer_fastest()
     else:
         logging.warning("ProxyManager created without proxies; supply API key or proxy list")
     return manager
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Playwright stack-capture patch
+
+Playwright records a Python stack trace on every API call so that driver errors
+can point back at user code. Scraping runs issue thousands of calls and never
+read those traces, so the capture is pure overhead there.
+
+Usage:
+    import pw_patch
+    pw_patch.apply()  # before sync_playwright()/async_playwright()
+
+Setting ``PW_INSPECT_STACK=0`` applies the patch automatically when the
+scraper modules are imported.
+"""
+
+import importlib
+import os
+import traceback
+from types import ModuleType
+from typing import List
+
+
+# Private Playwright modules that call traceback.extract_stack; not every
+# supported release ships all of them, so they are imported only on apply()
+_PATCHED_MODULE_NAMES = (
+    "playwright._impl._connection",
+    "playwright._impl._disposable",
+    "playwright._impl._sync_base",
+)
+
+
+class _NoStackTraceback:
+    """Stand-in for the ``traceback`` module whose ``extract_stack`` is free."""
+
+    @staticmethod
+    def extract_stack(*args, **kwargs) -> traceback.StackSummary:
+        return traceback.StackSummary()
+
+    def __getattr__(self, name):
+        return getattr(traceback, name)
+
+
+def _patched_modules() -> List[ModuleType]:
+    """Import the patch targets that exist in the installed Playwright."""
+    modules = []
+    for name in _PATCHED_MODULE_NAMES:
+        try:
+            modules.append(importlib.import_module(name))
+        except ImportError:
+            continue
+    return modules
+
+
+def apply() -> None:
+    """Stop Playwright from extracting a stack trace on every call. Safe to call twice."""
+    for module in _patched_modules():
+        if isinstance(getattr(module, "traceback", None), _NoStackTraceback):
+            continue
+        module.traceback = _NoStackTraceback()
+
+
+def apply_from_env() -> bool:
+    """Apply the patch when ``PW_INSPECT_STACK=0``; return whether it was applied."""
+    if os.environ.get("PW_INSPECT_STACK") == "0":
+        apply()
+        return True
+    return False
@@ -1,5 +1,6 @@
 """Test configuration and shared fixtures."""
 
+import os
 from pathlib import Path
 import sys
 import pytest
@@ -10,19 +11,48 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_fixture():
-    """Load file contents from the tests/fixtures directory."""
+    """Load file contents from the tests/fixtures directory, read eagerly once per session."""
 
     fixtures_dir = Path(__file__).parent / "fixtures"
+    preloaded = {
+        path.name: path.read_text(encoding="utf-8")
+        for path in fixtures_dir.iterdir()
+        if path.is_file()
+    }
 
     def _loader(name: str) -> str:
-        path = fixtures_dir / name
-        return path.read_text(encoding="utf-8")
+        return preloaded[name]
 
     return _loader
 
 
+@pytest.fixture(scope="session")
+def live_scraper(pytestconfig):
+    """One scraper whose browser session is shared by every live test in the run."""
+
+    if not pytestconfig.getoption("--run-live"):
+        pytest.skip("--run-live flag not provided")
+
+    use_proxies = (
+        pytestconfig.getoption("--live-use-proxies")
+        or os.getenv("LIVE_USE_PROXIES", "false").lower() in {"1", "true", "yes"}
+    )
+
+    proxy_manager = None
+    if use_proxies:
+        from proxy_manager import create_default_proxy_manager
+
+        proxy_manager = create_default_proxy_manager()
+
+    from google_maps_brand_scraper import GoogleMapsBrandScraper
+
+    scraper = GoogleMapsBrandScraper(use_proxies=use_proxies, proxy_manager=proxy_manager, keep_session=True)
+    yield scraper
+    scraper.cleanup()
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--run-live",
@@ -46,4 +76,6 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "live: marks tests that hit live Google Maps (deselect with --run-live)")
+    # Registered here so the mark is known even when pytest-xdist is not installed
+    config.addinivalue_line("markers", "xdist_group(name): keep tests on one pytest-xdist worker under --dist loadgroup")
 
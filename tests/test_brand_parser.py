@@ -6,7 +6,8 @@ import pytest
 from google_maps_brand_scraper import parse_directory_cards
 
 
-@pytest.fixture
+# Parsed once per session; tests must treat the soup as read-only
+@pytest.fixture(scope="session")
 def directory_soup(load_fixture):
     html = load_fixture("mall_directory.html")
     return BeautifulSoup(html, "html.parser")
@@ -44,7 +45,7 @@ def test_parse_directory_cards_no_duplicates(directory_soup):
     assert len(names) == len(set(names))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def modern_directory(load_fixture):
     html = load_fixture("mall_directory_modern.html")
     return BeautifulSoup(html, "html.parser")
@@ -68,3 +69,49 @@ def test_parse_directory_modern_cards(modern_directory):
         },
     ]
 
+
+
+class SnapshotPage:
+    """Page stub whose in-page container lookup returns a fixed result."""
+
+    def __init__(self, match, content=""):
+        self.match = match
+        self._content = content
+        self.evaluate_calls = 0
+
+    def evaluate(self, script, selectors):
+        self.evaluate_calls += 1
+        return self.match
+
+    def content(self):
+        return self._content
+
+
+def test_get_directory_cards_reads_container_in_one_evaluate(load_fixture):
+    from google_maps_brand_scraper import get_directory_cards
+
+    html = load_fixture("mall_directory.html")
+    page = SnapshotPage({"selector": "#directory", "html": html})
+
+    cards = get_directory_cards(page)
+
+    assert page.evaluate_calls == 1
+    assert [card["name"] for card in cards] == ["Brand A", "Brand B", "Store With Floor"]
+
+
+def test_get_directory_cards_falls_back_to_page_content(load_fixture):
+    from google_maps_brand_scraper import get_directory_cards
+
+    page = SnapshotPage(None, content=load_fixture("mall_directory.html"))
+
+    assert len(get_directory_cards(page)) == 3
+
+
+@pytest.mark.parametrize("fixture_name", ["mall_directory.html", "mall_directory_modern.html"])
+def test_lxml_parser_matches_html_parser(load_fixture, fixture_name):
+    pytest.importorskip("lxml")
+    html = load_fixture(fixture_name)
+
+    assert parse_directory_cards(BeautifulSoup(html, "lxml")) == parse_directory_cards(
+        BeautifulSoup(html, "html.parser")
+    )
@@ -0,0 +1,60 @@
+"""Tests for consent button selection in GoogleConsentHandler."""
+
+from google_consent_handler import GoogleConsentHandler
+
+
+class FakeButton:
+    def __init__(self, name, clicked, visible=True):
+        self.name = name
+        self.clicked = clicked
+        self.visible = visible
+
+    @property
+    def first(self):
+        return self
+
+    def is_visible(self):
+        return self.visible
+
+    def click(self):
+        self.clicked.append(self.name)
+
+
+class FakeCount:
+    def __init__(self, count):
+        self._count = count
+
+    def count(self):
+        return self._count
+
+
+class FakePage:
+    def __init__(self, buttons):
+        self.buttons = buttons
+        self.queries = []
+
+    def locator(self, selector):
+        self.queries.append(selector)
+        if ", " in selector:
+            return FakeCount(sum(1 for part in selector.split(", ") if part in self.buttons))
+        return self.buttons.get(selector) or FakeButton(selector, [], visible=False)
+
+
+def test_accept_all_wins_over_earlier_generic_match():
+    clicked = []
+    page = FakePage(
+        {
+            'button:has-text("Accept")': FakeButton("generic", clicked),
+            'button:has-text("Accept all")': FakeButton("accept-all", clicked),
+        }
+    )
+
+    assert GoogleConsentHandler()._try_click_selector(page)
+    assert clicked == ["accept-all"]
+
+
+def test_missing_buttons_cost_one_union_query():
+    page = FakePage({})
+
+    assert GoogleConsentHandler()._try_click_aria_label(page) is False
+    assert len(page.queries) == 1
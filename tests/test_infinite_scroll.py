@@ -1,6 +1,7 @@
 """Tests for directory infinite scroll helper."""
 
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 
 class FakeResponse:
@@ -31,19 +32,30 @@ class FakeLocator:
         self.scroll_calls = 0
         self.heights = list(heights or [])
         self.height_index = 0
+        self.metrics_calls = 0
 
-    def evaluate(self, script):
+    def evaluate(self, script, arg=None):
         if script and "scrollTo" in script:
             self.scroll_calls += 1
             return None
 
+        if script and "scrollHeight" in script and "children.length" in script:
+            self.metrics_calls += 1
+            return [self._next_height(), self._next_count()]
+
         if script == "el => el.scrollHeight":
-            if self.height_index < len(self.heights):
-                value = self.heights[self.height_index]
-                self.height_index += 1
-                return value
-            return self.heights[-1] if self.heights else 0
+            return self._next_height()
+
+        return self._next_count()
 
+    def _next_height(self):
+        if self.height_index < len(self.heights):
+            value = self.heights[self.height_index]
+            self.height_index += 1
+            return value
+        return self.heights[-1] if self.heights else 0
+
+    def _next_count(self):
         if self.index < len(self.counts):
             value = self.counts[self.index]
             self.index += 1
@@ -64,7 +76,7 @@ class FakeLocator:
 class FakePage:
     def __init__(self, container, responses=None):
         self.container = container
-        self.sleep_calls = []
+        self.wait_calls = []
         self.events = {}
         self.off_calls = []
         self.responses_to_fire = list(responses or [])
@@ -74,12 +86,15 @@ class FakePage:
             return self.container
         raise AssertionError(f"Unexpected selector {selector}")
 
-    def wait_for_timeout(self, ms):
-        self.sleep_calls.append(ms)
+    def wait_for_event(self, event_name, predicate=None, timeout=None):
+        self.wait_calls.append((event_name, timeout))
         if self.responses_to_fire:
             response = self.responses_to_fire.pop(0)
-            for callback in self.events.get("response", []):
+            for callback in self.events.get(event_name, []):
                 callback(response)
+            if predicate is None or predicate(response):
+                return response
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
 
     def on(self, event_name, callback):
         self.events.setdefault(event_name, []).append(callback)
@@ -111,6 +126,8 @@ def test_scroll_stops_after_repeated_counts(scroll_helper):
     assert telemetry.final_card_count == 22
     assert telemetry.pb_sentinel_triggered is False
     assert page.off_calls, "Listener should be detached"
+    # One fused metrics read up front plus one per scroll
+    assert container.metrics_calls == telemetry.scrolls_performed + 1
 
 
 def test_scroll_stops_when_pb_sentinel_triggered(scroll_helper):
@@ -125,6 +142,7 @@ def test_scroll_stops_when_pb_sentinel_triggered(scroll_helper):
     assert telemetry.pb_sentinel_triggered is True
     assert telemetry.scrolls_performed == 1
     assert telemetry.responses_observed == 1
+    assert page.wait_calls == [("response", 10)]
 
 
 def test_scroll_caps_total_iterations(scroll_helper):
@@ -144,3 +162,46 @@ def test_scroll_caps_total_iterations(scroll_helper):
 
     assert telemetry.scrolls_performed == 3
 
+
+
+class LaggingLocator(FakeLocator):
+    """Cards render only after the page waits for them, never with the response."""
+
+    def __init__(self, initial, batch):
+        super().__init__([initial])
+        self.rendered = initial
+        self.batch = batch
+        self.pending = 0
+        self.growth_waits = []
+
+    def evaluate(self, script, arg=None):
+        if script and "MutationObserver" in script:
+            self.growth_waits.append(arg)
+            self.rendered += self.pending
+            self.pending = 0
+            return [self.rendered * 100, self.rendered]
+        if script and "scrollHeight" in script and "children.length" in script:
+            return [self.rendered * 100, self.rendered]
+        return super().evaluate(script, arg)
+
+
+class LaggingPage(FakePage):
+    def wait_for_event(self, event_name, predicate=None, timeout=None):
+        if self.responses_to_fire:
+            self.container.pending += self.container.batch
+        return super().wait_for_event(event_name, predicate=predicate, timeout=timeout)
+
+
+def test_scroll_waits_for_cards_to_render_after_pb_response(scroll_helper):
+    from google_maps_brand_scraper import DIRECTORY_CONTAINER_SELECTORS
+
+    container = LaggingLocator(initial=10, batch=5)
+    responses = [FakeResponse("https://maps.google.com/preview/pb=?page=%s" % index) for index in range(3)]
+    page = LaggingPage(container, responses=responses)
+
+    telemetry = scroll_helper(page, DIRECTORY_CONTAINER_SELECTORS, max_empty_scrolls=2, wait_between_scrolls_ms=300)
+
+    # Every batch is counted even though none had rendered when its response arrived
+    assert telemetry.final_card_count == 25
+    assert [arg[0] for arg in container.growth_waits] == [10, 15, 20]
+    assert all(0 <= arg[1] <= 300 for arg in container.growth_waits)
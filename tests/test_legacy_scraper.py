@@ -0,0 +1,93 @@
+"""Tests for how the legacy scraper mixes its sync and async Playwright stacks."""
+
+import asyncio
+
+import pytest
+
+from legacy import google_maps_scraper
+from legacy.google_maps_scraper import GoogleMapsScraper
+
+
+def test_entering_the_scraper_does_not_start_sync_playwright(monkeypatch):
+    monkeypatch.setattr(
+        google_maps_scraper, "sync_playwright", lambda: pytest.fail("sync Playwright started on __enter__")
+    )
+
+    with GoogleMapsScraper() as scraper:
+        assert scraper._context is None
+
+
+def test_sync_batch_runs_while_an_event_loop_is_running(monkeypatch):
+    async def fake_batch(self, urls, max_concurrency=5):
+        await asyncio.sleep(0)
+        return [[url] for url in urls]
+
+    monkeypatch.setattr(GoogleMapsScraper, "scrape_brands_from_urls", fake_batch)
+    scraper = GoogleMapsScraper()
+
+    async def caller_with_running_loop():
+        # Stands in for sync Playwright, which keeps a loop running in this thread
+        return scraper.scrape_brands_from_urls_sync(["a", "b"])
+
+    assert asyncio.run(caller_with_running_loop()) == [["a"], ["b"]]
+
+
+class FlakyAsyncPage:
+    async def close(self):
+        raise RuntimeError("target closed")
+
+
+class FlakyAsyncContext:
+    def __init__(self):
+        self.opened = 0
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def route(self, *args):
+        pass
+
+    async def new_page(self):
+        self.opened += 1
+        if self.opened == 1:
+            raise RuntimeError("browser has disconnected")
+        return FlakyAsyncPage()
+
+
+class FakeAsyncBrowser:
+    async def new_context(self):
+        return FlakyAsyncContext()
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncPlaywright:
+    def __init__(self):
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        return FakeAsyncBrowser()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+def test_failed_page_open_or_close_returns_the_context_to_the_pool(monkeypatch):
+    async def fake_scrape(self, page, url):
+        return [url]
+
+    monkeypatch.setattr(google_maps_scraper, "async_playwright", FakeAsyncPlaywright)
+    monkeypatch.setattr(google_maps_scraper.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(GoogleMapsScraper, "_scrape_with_browser_async", fake_scrape)
+    scraper = GoogleMapsScraper()
+
+    results = asyncio.run(
+        asyncio.wait_for(scraper.scrape_brands_from_urls(["a", "b", "c"], max_concurrency=3), timeout=5)
+    )
+
+    # The first page never opens; the single pooled context still serves the rest
+    assert results == [[], ["b"], ["c"]]
@@ -0,0 +1,386 @@
+"""Tests for proxy state handling and the Webshare list cache."""
+
+import gc
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+
+import pytest
+
+import proxy_manager
+from proxy_manager import ProxyManager
+
+
+class FakeResponse:
+    def __init__(self, results):
+        self._results = results
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"results": self._results}
+
+
+class FakeRequests:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse([
+            {"proxy_address": "10.0.0.1", "port": 8000, "username": "u", "password": "p"},
+        ])
+
+
+def test_env_loaded_guard_does_not_leak_into_child_processes(monkeypatch, tmp_path):
+    loaded = []
+    monkeypatch.setattr(proxy_manager, "_ENV_LOADED", False)
+    monkeypatch.setattr(proxy_manager, "_MODULE_DIR", tmp_path)
+    monkeypatch.setattr(proxy_manager, "load_dotenv", lambda path, override=False: loaded.append(path))
+    (tmp_path / ".env").write_text("WEBSHARE_API_KEY=key\n")
+
+    proxy_manager._load_env()
+    proxy_manager._load_env()
+
+    assert loaded.count(tmp_path / ".env") == 1
+    assert not any(name.startswith("BRAND_SCRAPER_ENV") for name in os.environ)
+
+
+def test_webshare_fetch_is_cached_on_disk(monkeypatch, tmp_path):
+    fake_requests = FakeRequests()
+    monkeypatch.setattr(proxy_manager, "requests", fake_requests)
+
+    first = proxy_manager._fetch_webshare_proxies("key", storage_dir=tmp_path)
+    second = proxy_manager._fetch_webshare_proxies("key", storage_dir=tmp_path)
+
+    assert first == second == ["10.0.0.1:8000:u:p"]
+    assert fake_requests.calls == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_webshare_cache_is_not_shared_across_api_keys(monkeypatch, tmp_path):
+    fake_requests = FakeRequests()
+    monkeypatch.setattr(proxy_manager, "requests", fake_requests)
+
+    proxy_manager._fetch_webshare_proxies("old-key", storage_dir=tmp_path)
+    proxy_manager._fetch_webshare_proxies("new-key", storage_dir=tmp_path)
+
+    assert fake_requests.calls == 2
+
+
+def test_webshare_cache_is_private_to_the_owner(monkeypatch, tmp_path):
+    monkeypatch.setattr(proxy_manager, "requests", FakeRequests())
+
+    proxy_manager._fetch_webshare_proxies("key", storage_dir=tmp_path)
+
+    (cache_path,) = tmp_path.glob("webshare_*.json")
+    assert cache_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_webshare_cache_expires_after_ttl(monkeypatch, tmp_path):
+    fake_requests = FakeRequests()
+    monkeypatch.setattr(proxy_manager, "requests", fake_requests)
+    monkeypatch.setattr(proxy_manager, "WEBSHARE_CACHE_TTL", 60)
+
+    proxy_manager._fetch_webshare_proxies("key", storage_dir=tmp_path)
+    (cache_path,) = tmp_path.glob("webshare_*.json")
+    stale = time.time() - 120
+    os.utime(cache_path, (stale, stale))
+
+    proxy_manager._fetch_webshare_proxies("key", storage_dir=tmp_path)
+
+    assert fake_requests.calls == 2
+
+
+def _stats_files(storage_dir):
+    db = sqlite3.connect(storage_dir / "proxy_state.sqlite")
+    try:
+        return [slug for (slug,) in db.execute("SELECT slug FROM proxy_stats")]
+    finally:
+        db.close()
+
+
+def test_proxy_state_writes_are_batched(tmp_path):
+    manager = ProxyManager(["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p"], storage_dir=str(tmp_path))
+
+    proxy = manager.get_current_proxy()
+    manager.record_success(proxy)
+    manager.get_next_proxy()
+
+    assert _stats_files(tmp_path) == []
+
+    manager._flush_all()
+
+    assert len(_stats_files(tmp_path)) == 2
+    reloaded = ProxyManager(["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p"], storage_dir=str(tmp_path))
+    assert sum(p["stats"].success for p in reloaded.proxies) == 1
+
+
+def test_rotation_flushes_after_interval(monkeypatch, tmp_path):
+    manager = ProxyManager(["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p"], storage_dir=str(tmp_path))
+    monkeypatch.setattr(proxy_manager, "_FLUSH_INTERVAL_SECONDS", 0.0)
+
+    manager.get_next_proxy()
+
+    assert len(_stats_files(tmp_path)) == 1
+    assert manager._dirty == {}
+
+
+def test_legacy_stats_files_are_migrated(tmp_path):
+    probe = ProxyManager(storage_dir=str(tmp_path))
+    proxy_info = {"ip": "10.0.0.1", "port": "8000", "username": "u"}
+    legacy_dir = tmp_path / probe._legacy_slug_for_proxy(proxy_info)
+    legacy_dir.mkdir()
+    (legacy_dir / "stats.json").write_text(json.dumps({"uses": 7, "success": 3}))
+
+    manager = ProxyManager(["10.0.0.1:8000:u:p"], storage_dir=str(tmp_path))
+    manager._flush_all()
+
+    assert manager.proxies[0]["stats"].uses == 7
+    assert _stats_files(tmp_path) == [probe._slug_for_proxy(proxy_info)]
+
+
+def test_slug_keeps_its_length_after_hash_change(tmp_path):
+    manager = ProxyManager(storage_dir=str(tmp_path))
+    proxy_info = {"ip": "10.0.0.1", "port": "8000", "username": "u"}
+
+    slug = manager._slug_for_proxy(proxy_info)
+    legacy_slug = manager._legacy_slug_for_proxy(proxy_info)
+
+    assert slug != legacy_slug
+    assert len(slug) == len(legacy_slug)
+    assert slug.startswith("10-0-0-1-")
+
+
+def test_get_working_proxy_checks_stale_proxies_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(proxy_manager.random, "shuffle", lambda seq: None)
+    manager = ProxyManager(
+        ["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p", "10.0.0.3:8000:u:p"],
+        storage_dir=str(tmp_path),
+    )
+    tested = []
+
+    def fake_test_proxy(proxy_info, timeout=10):
+        tested.append(proxy_info["ip"])
+        proxy_info["stats"].last_health_check = time.time()
+        proxy_info["stats"].healthy = proxy_info["ip"] != "10.0.0.1"
+        return proxy_info["stats"].healthy
+
+    monkeypatch.setattr(manager, "test_proxy", fake_test_proxy)
+
+    assert manager.get_working_proxy()["ip"] == "10.0.0.2"
+    assert sorted(tested) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+    assert manager.get_working_proxy()["ip"] == "10.0.0.2"
+    assert len(tested) == 3
+
+
+def test_blocked_proxy_is_quarantined_until_period_expires(monkeypatch, tmp_path):
+    monkeypatch.setattr(proxy_manager.random, "shuffle", lambda seq: None)
+    manager = ProxyManager(
+        ["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p", "10.0.0.3:8000:u:p"],
+        storage_dir=str(tmp_path),
+        quarantine_period=60,
+    )
+
+    blocked = manager.get_current_proxy()
+    manager.record_failure(blocked, block=True)
+
+    seen = {manager.get_next_proxy()["ip"] for _ in range(4)}
+    assert seen == {"10.0.0.2", "10.0.0.3"}
+
+    now = time.time()
+    monkeypatch.setattr(proxy_manager.time, "time", lambda: now + 61)
+
+    seen = {manager.get_next_proxy()["ip"] for _ in range(3)}
+    assert seen == {"10.0.0.1", "10.0.0.2", "10.0.0.3"}
+
+
+def test_rate_limit_moves_to_the_next_proxy_exactly_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(proxy_manager.random, "shuffle", lambda seq: None)
+    monkeypatch.setattr(proxy_manager.time, "sleep", lambda seconds: None)
+    manager = ProxyManager(
+        ["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p", "10.0.0.3:8000:u:p"],
+        storage_dir=str(tmp_path),
+        quarantine_period=60,
+    )
+
+    assert manager.mark_rate_limit(backoff_seconds=0)["ip"] == "10.0.0.2"
+    assert manager.proxies[0]["stats"].blocks == 1
+
+
+def test_rotation_never_runs_dry_while_all_proxies_are_quarantined(tmp_path):
+    manager = ProxyManager(["10.0.0.1:8000:u:p"], storage_dir=str(tmp_path))
+
+    proxy = manager.get_current_proxy()
+    manager.record_failure(proxy, block=True)
+
+    assert manager.get_next_proxy() is proxy
+    assert manager.get_proxy_stats()["current_index"] == 0
+
+
+def test_proxy_stats_round_trip_through_to_dict():
+    stats = proxy_manager.ProxyStats(uses=2, healthy=False)
+
+    assert proxy_manager.ProxyStats(**stats.to_dict()) == stats
+
+
+class FakeSession:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs["proxies"])
+        self.timeout = kwargs["timeout"]
+        return type("Response", (), {"status_code": self.status_code})()
+
+    def close(self):
+        self.closed = True
+
+
+def _use_session(monkeypatch, manager, session):
+    monkeypatch.setattr(manager, "_http_session", lambda: session)
+
+
+def test_health_checks_reuse_a_session_per_thread(tmp_path):
+    manager = ProxyManager(["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p"], storage_dir=str(tmp_path))
+
+    first = manager._http_session()
+    assert manager._http_session() is first
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(manager._http_session()))
+    worker.start()
+    worker.join()
+    assert other[0] is not first
+
+    manager.close()
+    assert manager._sessions == []
+    assert manager._http_session() is not first
+    manager.close()
+
+
+def test_test_proxy_uses_the_given_session(tmp_path):
+    manager = ProxyManager(["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p"], storage_dir=str(tmp_path))
+    session = FakeSession()
+
+    assert all(manager.test_proxy(proxy, session=session) for proxy in manager.proxies)
+
+    assert session.calls == [proxy["requests_proxies"] for proxy in manager.proxies]
+    # Dead proxies are rejected by the short connect timeout, not the read timeout
+    assert session.timeout == (3, 10)
+
+
+def test_health_results_persist_so_next_run_skips_fresh_checks(monkeypatch, tmp_path):
+    proxies = ["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p"]
+    manager = ProxyManager(proxies, storage_dir=str(tmp_path))
+    _use_session(monkeypatch, manager, FakeSession())
+
+    assert manager.health_check_all() == 2
+
+    restarted = ProxyManager(proxies, storage_dir=str(tmp_path))
+    monkeypatch.setattr(restarted, "test_proxy", lambda proxy_info: pytest.fail("re-probed"))
+
+    assert restarted.health_check_all() == 0
+    assert all(proxy["stats"].healthy for proxy in restarted.proxies)
+
+    tested = []
+    monkeypatch.setattr(restarted, "test_proxy", lambda proxy_info: tested.append(proxy_info["ip"]))
+
+    assert restarted.health_check_all(force=True) == 2
+    assert sorted(tested) == ["10.0.0.1", "10.0.0.2"]
+
+
+def test_generate_204_counts_as_healthy(monkeypatch, tmp_path):
+    monkeypatch.delenv("WEBSHARE_HEALTH_CHECK_URL", raising=False)
+    manager = ProxyManager(["10.0.0.1:8000:u:p"], storage_dir=str(tmp_path))
+    _use_session(monkeypatch, manager, FakeSession(status_code=204))
+
+    assert manager.health_check_url.endswith("/generate_204")
+    assert manager.test_proxy(manager.proxies[0]) is True
+
+
+def test_prefer_fastest_orders_rotation_by_smoothed_latency(tmp_path):
+    manager = ProxyManager(
+        ["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p", "10.0.0.3:8000:u:p", "10.0.0.4:8000:u:p"],
+        storage_dir=str(tmp_path),
+    )
+    latencies = {"10.0.0.1": 9.0, "10.0.0.2": 0.4, "10.0.0.3": 0.0, "10.0.0.4": 1.2}
+    for proxy in manager.proxies:
+        proxy["stats"].ewma_latency = latencies[proxy["ip"]]
+
+    assert [p["ip"] for p in manager.sorted_by_latency(max_latency=5.0)] == [
+        "10.0.0.2",
+        "10.0.0.4",
+        "10.0.0.3",
+    ]
+
+    manager.prefer_fastest(max_latency=5.0)
+
+    assert [p["ip"] for p in manager._healthy] == ["10.0.0.2", "10.0.0.4", "10.0.0.3", "10.0.0.1"]
+    assert manager.get_current_proxy()["ip"] == "10.0.0.2"
+
+
+def test_health_check_updates_smoothed_latency(tmp_path):
+    manager = ProxyManager(["10.0.0.1:8000:u:p"], storage_dir=str(tmp_path))
+    stats = manager.proxies[0]["stats"]
+
+    manager.test_proxy(manager.proxies[0], session=FakeSession())
+    first = stats.ewma_latency
+    manager.test_proxy(manager.proxies[0], session=FakeSession())
+
+    assert first > 0
+    assert stats.ewma_latency == pytest.approx(0.3 * stats.last_latency + 0.7 * first)
+
+
+def test_health_check_stops_once_enough_proxies_are_healthy(monkeypatch, tmp_path):
+    manager = ProxyManager(
+        ["10.0.0.1:8000:u:p", "10.0.0.2:8000:u:p", "10.0.0.3:8000:u:p", "10.0.0.4:8000:u:p"],
+        storage_dir=str(tmp_path),
+    )
+    tested = []
+    first_done = threading.Event()
+
+    def fake_test_proxy(proxy_info):
+        tested.append(proxy_info["ip"])
+        if len(tested) > 1:
+            # Hold the single worker until the first result has been handled
+            first_done.wait(timeout=5)
+        return True
+
+    monkeypatch.setattr(manager, "test_proxy", fake_test_proxy)
+    original_cancel = Future.cancel
+
+    def cancel_then_release(future):
+        cancelled = original_cancel(future)
+        first_done.set()
+        return cancelled
+
+    monkeypatch.setattr(Future, "cancel", cancel_then_release)
+
+    checked = manager.health_check_all(concurrency=1, stop_after=1)
+
+    # A check the worker picked up before the cancel still finishes; the rest never start
+    assert checked == len(tested)
+    assert len(tested) <= 2
+
+
+def test_exit_hook_skips_closed_managers_and_holds_no_references(tmp_path):
+    closed = ProxyManager(["10.0.0.1:8000:u:p"], storage_dir=str(tmp_path / "closed"))
+    closed.close()
+    dropped = ProxyManager(["10.0.0.2:8000:u:p"], storage_dir=str(tmp_path / "dropped"))
+    dropped_ref = weakref.ref(dropped)
+
+    del dropped
+    gc.collect()
+
+    assert closed not in proxy_manager._OPEN_MANAGERS
+    assert dropped_ref() is None
+    proxy_manager._flush_open_managers()
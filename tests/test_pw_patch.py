@@ -0,0 +1,42 @@
+"""Tests for the opt-in Playwright stack-capture patch."""
+
+from playwright._impl import _connection
+
+import pw_patch
+
+
+def test_apply_replaces_stack_extraction(monkeypatch):
+    for module in pw_patch._patched_modules():
+        monkeypatch.setattr(module, "traceback", module.traceback)
+
+    pw_patch.apply()
+    pw_patch.apply()
+
+    for module in pw_patch._patched_modules():
+        assert list(module.traceback.extract_stack(limit=10)) == []
+        assert module.traceback.StackSummary is not None
+
+
+def test_apply_from_env_is_opt_in(monkeypatch):
+    for module in pw_patch._patched_modules():
+        monkeypatch.setattr(module, "traceback", module.traceback)
+    monkeypatch.delenv("PW_INSPECT_STACK", raising=False)
+
+    assert pw_patch.apply_from_env() is False
+    assert not isinstance(_connection.traceback, pw_patch._NoStackTraceback)
+
+    monkeypatch.setenv("PW_INSPECT_STACK", "0")
+    assert pw_patch.apply_from_env() is True
+
+
+def test_apply_skips_modules_missing_from_older_playwright(monkeypatch):
+    monkeypatch.setattr(_connection, "traceback", _connection.traceback)
+    monkeypatch.setattr(
+        pw_patch,
+        "_PATCHED_MODULE_NAMES",
+        ("playwright._impl._connection", "playwright._impl._not_in_this_release"),
+    )
+
+    pw_patch.apply()
+
+    assert isinstance(_connection.traceback, pw_patch._NoStackTraceback)
@@ -101,3 +101,77 @@ def test_scrape_brands_reuses_authenticated_page(monkeypatch):
     assert session_instance.requested_urls == [target_url]
     assert session_instance.cleaned_up is True
 
+
+
+def test_kept_session_manager_is_shared_until_cleanup(monkeypatch):
+    """A scraper built with keep_session reuses one session manager across URLs."""
+
+    class FakeSessionManager:
+        instances = []
+
+        def __init__(self, **kwargs):
+            self.cleaned_up = False
+            FakeSessionManager.instances.append(self)
+
+        def cleanup(self):
+            self.cleaned_up = True
+
+    monkeypatch.setattr(
+        "google_maps_brand_scraper.GoogleMapsSessionManager",
+        FakeSessionManager,
+    )
+
+    scraper = GoogleMapsBrandScraper(headless=True, keep_session=True)
+
+    first = scraper._get_session_manager()
+    assert scraper._get_session_manager() is first
+    assert first.cleaned_up is False
+
+    scraper.cleanup()
+    assert first.cleaned_up is True
+    assert scraper._get_session_manager() is not first
+    assert len(FakeSessionManager.instances) == 2
+
+
+def test_kept_session_loads_each_url_in_the_long_lived_page(monkeypatch):
+    """With keep_session, scrape_brands goes through navigate() rather than opening new pages."""
+
+    class FakePage:
+        def __init__(self):
+            self.url = "about:blank"
+
+        def on(self, *args):
+            pass
+
+        def off(self, *args):
+            pass
+
+        def wait_for_load_state(self, *args, **kwargs):
+            pass
+
+    page = FakePage()
+
+    class FakeSessionManager:
+        def __init__(self, **kwargs):
+            self.navigated = []
+
+        def navigate(self, target_url):
+            self.navigated.append(target_url)
+            page.url = target_url
+            return page
+
+        def get_authenticated_page(self, target_url=None):
+            raise AssertionError("kept sessions should reuse their page")
+
+        def cleanup(self):
+            pass
+
+    monkeypatch.setattr("google_maps_brand_scraper.GoogleMapsSessionManager", FakeSessionManager)
+    monkeypatch.setattr(GoogleMapsBrandScraper, "_ensure_directory_view", lambda self, page: False)
+    monkeypatch.setattr(GoogleMapsBrandScraper, "_extract_brands_from_directory", lambda self, page: [page.url])
+
+    scraper = GoogleMapsBrandScraper(headless=True, keep_session=True)
+    urls = ["https://www.google.com/maps/place/A", "https://www.google.com/maps/place/B"]
+
+    assert [scraper.scrape_brands(url) for url in urls] == [[url] for url in urls]
+    assert scraper._session_manager.navigated == urls
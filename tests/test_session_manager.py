@@ -0,0 +1,758 @@
+"""Unit tests for session manager helpers that do not need a live browser."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from google_maps_session_manager import (
+    _RECAPTCHA_URL_RE,
+    AsyncGoogleMapsSessionManager,
+    GoogleMapsSessionManager,
+)
+
+
+class FakeProxyManager:
+    def __init__(self, proxies):
+        self.proxies = list(proxies)
+        self.index = 0
+        self.rotations = 0
+        self.probes = 0
+        self.successes = []
+        self.failures = []
+        self.blocks = []
+
+    def get_working_proxy(self, max_attempts=3):
+        self.probes += 1
+        return self.proxies[self.index]
+
+    def get_next_proxy(self):
+        self.rotations += 1
+        self.index = (self.index + 1) % len(self.proxies)
+        return self.proxies[self.index]
+
+    def record_success(self, proxy):
+        self.successes.append(proxy["ip"])
+
+    def record_failure(self, proxy, block=False):
+        self.failures.append(proxy["ip"])
+        if block:
+            self.blocks.append(proxy["ip"])
+
+
+@pytest.fixture
+def proxies():
+    return [
+        {"ip": "10.0.0.1", "port": "8000"},
+        {"ip": "10.0.0.2", "port": "8000"},
+    ]
+
+
+def test_acquire_proxy_skips_greylisted(tmp_path, proxies):
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+
+    manager._session_greylist["10.0.0.1:8000"] = 0.0
+    manager.GREYLIST_TTL_SECONDS = float("inf")
+
+    proxy = manager._acquire_proxy()
+
+    assert proxy is proxies[1]
+    assert proxy_manager.rotations == 1
+    assert "10.0.0.1:8000" in manager._session_greylist
+
+
+def test_acquire_proxy_expires_greylist_entries(tmp_path, proxies):
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+
+    manager._session_greylist["10.0.0.1:8000"] = 0.0
+    manager.GREYLIST_TTL_SECONDS = 0.0
+
+    proxy = manager._acquire_proxy()
+
+    assert proxy is proxies[0]
+    assert proxy_manager.rotations == 0
+    assert manager._session_greylist == {}
+
+
+def test_acquire_proxy_sticks_until_blocked(tmp_path, proxies):
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+    manager._current_proxy_info = proxies[0]
+
+    assert manager._acquire_proxy() is proxies[0]
+    assert proxy_manager.probes == 0
+
+    manager.force_rotate()
+
+    assert manager._acquire_proxy() is proxies[1]
+    assert proxy_manager.probes == 1
+
+
+def test_acquire_proxy_all_greylisted(tmp_path, proxies):
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+    manager.GREYLIST_TTL_SECONDS = float("inf")
+    manager._session_greylist = {"10.0.0.1:8000": 0.0, "10.0.0.2:8000": 0.0}
+
+    assert manager._acquire_proxy() is None
+
+
+class FakeContext:
+    def __init__(self, state):
+        self.state = state
+        self.calls = 0
+
+    def storage_state(self):
+        self.calls += 1
+        return self.state
+
+
+def test_save_storage_state_skips_unchanged_shards(tmp_path, monkeypatch):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeContext(
+        {
+            "cookies": [{"name": "CONSENT"}],
+            "origins": [{"origin": "https://www.google.com", "localStorage": []}],
+        }
+    )
+
+    writes = []
+    real_replace = os.replace
+
+    def record_replace(src, dst):
+        writes.append(Path(dst).name)
+        real_replace(src, dst)
+
+    monkeypatch.setattr("google_maps_session_manager.os.replace", record_replace)
+
+    manager._save_storage_state()
+    assert len(writes) == 3
+    assert {"cookies.json", "manifest.json"} <= set(writes)
+
+    writes.clear()
+    manager._save_storage_state()
+    assert writes == []
+
+    manager._context.state["cookies"].append({"name": "SOCS"})
+    manager._save_storage_state()
+    assert writes == ["cookies.json", "manifest.json"]
+    assert manager._storage_dirty is False
+
+
+def test_load_storage_state_round_trips_shards(tmp_path):
+    state = {
+        "cookies": [{"name": "CONSENT", "value": "YES+"}],
+        "origins": [
+            {"origin": "https://www.google.com", "localStorage": [{"name": "a", "value": "1"}]},
+            {"origin": "https://consent.google.com", "localStorage": []},
+        ],
+    }
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeContext(state)
+    manager._save_storage_state()
+
+    assert manager._load_storage_state() == state
+    assert manager._storage_state_is_fresh()
+
+    manager._context.state = {"cookies": state["cookies"], "origins": state["origins"][:1]}
+    manager._save_storage_state()
+
+    assert len(list((manager.storage_state_dir / "origins").iterdir())) == 1
+    assert manager._load_storage_state() == manager._context.state
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    def abort(self):
+        self.outcome = "abort"
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+@pytest.mark.parametrize(
+    "url, resource_type, expected",
+    [
+        ("https://www.google.com/maps", "document", "fallback"),
+        ("https://www.google.com/maps/vt?pb=tile", "image", "abort"),
+        ("https://fonts.gstatic.com/s/roboto.woff2", "font", "abort"),
+        ("https://www.googletagmanager.com/gtag/js", "script", "abort"),
+        ("https://www.google.com/maps/preview/place?pb=1", "xhr", "fallback"),
+    ],
+)
+def test_auth_phase_router(tmp_path, url, resource_type, expected):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    route = FakeRoute(url, resource_type)
+
+    manager._auth_phase_router(route)
+
+    assert route.outcome == expected
+
+
+class FakeAsyncPage:
+    def __init__(self, delay, fail):
+        self.delay = delay
+        self.fail = fail
+        self.url = "about:blank"
+
+    async def goto(self, url, **kwargs):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("proxy refused connection")
+        self.url = url
+
+
+class FakeAsyncContext:
+    def __init__(self, page):
+        self.page = page
+        self.closed = False
+
+    async def new_page(self):
+        return self.page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncBrowser:
+    def __init__(self, behaviour):
+        self.behaviour = behaviour
+        self.contexts = {}
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, proxy=None, **kwargs):
+        ip = proxy["server"].split("//")[1].split(":")[0]
+        delay, fail = self.behaviour[ip]
+        context = FakeAsyncContext(FakeAsyncPage(delay, fail))
+        self.contexts[ip] = context
+        return context
+
+
+def test_race_proxies_keeps_fastest_and_closes_losers():
+    proxies = [
+        {"ip": "10.0.0.1", "port": "8000"},
+        {"ip": "10.0.0.2", "port": "8000"},
+        {"ip": "10.0.0.3", "port": "8000"},
+    ]
+    proxy_manager = FakeProxyManager(proxies)
+    browser = FakeAsyncBrowser(
+        {"10.0.0.1": (0.0, True), "10.0.0.2": (0.01, False), "10.0.0.3": (5.0, False)}
+    )
+    manager = AsyncGoogleMapsSessionManager(proxy_manager=proxy_manager)
+    manager._browser = browser
+
+    page = asyncio.run(manager._race_proxies("https://www.google.com/maps", k=3))
+
+    assert page.url == "https://www.google.com/maps"
+    assert manager._current_proxy_info is proxies[1]
+    assert proxy_manager.failures == ["10.0.0.1"]
+    assert proxy_manager.successes == ["10.0.0.2"]
+    assert browser.contexts["10.0.0.1"].closed
+    assert browser.contexts["10.0.0.3"].closed
+    assert not browser.contexts["10.0.0.2"].closed
+
+
+def test_race_proxies_caps_hung_attempts():
+    proxies = [{"ip": "10.0.0.1", "port": "8000"}, {"ip": "10.0.0.2", "port": "8000"}]
+    proxy_manager = FakeProxyManager(proxies)
+    browser = FakeAsyncBrowser({"10.0.0.1": (5.0, False), "10.0.0.2": (5.0, False)})
+    manager = AsyncGoogleMapsSessionManager(proxy_manager=proxy_manager, probe_timeout=0.05)
+    manager._browser = browser
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(manager._race_proxies("https://www.google.com/maps", k=2))
+
+    assert sorted(proxy_manager.failures) == ["10.0.0.1", "10.0.0.2"]
+    # Timeouts count as failures but do not quarantine the proxy
+    assert proxy_manager.blocks == []
+    assert all(context.closed for context in browser.contexts.values())
+
+
+def test_probe_timeout_defaults_past_the_navigation_timeout():
+    manager = AsyncGoogleMapsSessionManager(navigation_timeout=60000)
+
+    assert manager.probe_timeout > 60
+
+
+def test_recaptcha_route_flags_detection(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    route = FakeRoute("https://www.gstatic.com/recaptcha/releases/api.js", "script")
+
+    manager._recaptcha_route(route)
+
+    assert manager._recaptcha_detected
+    assert route.outcome == "fallback"
+
+
+class FakeSyncPage:
+    def __init__(self):
+        self.url = "about:blank"
+        self.visits = []
+
+    def goto(self, url, **kwargs):
+        self.visits.append(url)
+        # Maps rewrites the URL with a viewport suffix after loading
+        self.url = url + "/@51.5,-0.1,15z"
+
+    def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    def wait_for_selector(self, *args, **kwargs):
+        pass
+
+    def wait_for_function(self, *args, **kwargs):
+        pass
+
+    def wait_for_timeout(self, *args, **kwargs):
+        pass
+
+    def add_locator_handler(self, *args, **kwargs):
+        pass
+
+    def get_by_role(self, *args, **kwargs):
+        return None
+
+    def is_closed(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeSyncContext:
+    def __init__(self):
+        self.pages = []
+
+    def new_page(self):
+        page = FakeSyncPage()
+        self.pages.append(page)
+        return page
+
+
+def test_session_flow_skips_second_navigation_after_probe(tmp_path, monkeypatch):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeSyncContext()
+    monkeypatch.setattr(manager, "_start_browser", lambda: None)
+
+    target = "https://www.google.com/maps/place/Westfield"
+    page = manager._get_page_with_session_management(target)
+
+    assert len(manager._context.pages) == 1
+    assert page.visits == [target]
+
+
+def test_slow_maps_render_does_not_fail_the_auth_probe(tmp_path):
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    class SlowPage(FakeSyncPage):
+        def wait_for_selector(self, *args, **kwargs):
+            raise PlaywrightTimeoutError("Timeout 4000ms exceeded")
+
+    class SlowContext(FakeSyncContext):
+        def new_page(self):
+            page = SlowPage()
+            self.pages.append(page)
+            return page
+
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = SlowContext()
+
+    page = manager._is_authenticated(probe_url="https://www.google.com/maps")
+
+    assert page is manager._context.pages[0]
+    assert manager._last_nav_url == "https://www.google.com/maps"
+
+
+def test_session_flow_probe_loads_target_without_auth_routing(tmp_path, monkeypatch):
+    class RoutedContext(FakeSyncContext):
+        def unroute(self, *args):
+            pass
+
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = RoutedContext()
+    manager._auth_routing_active = True
+    monkeypatch.setattr(manager, "_start_browser", lambda: None)
+    routed_during_goto = []
+    real_goto = FakeSyncPage.goto
+
+    def recording_goto(page, url, **kwargs):
+        routed_during_goto.append(manager._auth_routing_active)
+        real_goto(page, url, **kwargs)
+
+    monkeypatch.setattr(FakeSyncPage, "goto", recording_goto)
+
+    target = "https://www.google.com/maps/place/Westfield"
+    page = manager._get_page_with_session_management(target)
+
+    # The probe is the only target load, so its assets must not be aborted
+    assert page.visits == [target]
+    assert routed_during_goto == [False]
+
+
+def test_har_context_kwargs_omit_bodies_by_default(tmp_path):
+    manager = GoogleMapsSessionManager(
+        user_data_dir=str(tmp_path), record_har=True, har_output_dir=str(tmp_path / "har")
+    )
+
+    kwargs = manager._har_context_kwargs()
+
+    assert kwargs["record_har_mode"] == "minimal"
+    assert kwargs["record_har_content"] == "omit"
+    assert kwargs["record_har_path"] == str(manager._active_har_path)
+
+    manager.har_full = True
+    assert manager._har_context_kwargs()["record_har_mode"] == "full"
+    assert "record_har_content" not in manager._har_context_kwargs()
+
+
+def test_storage_state_not_fresh_when_truncated(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeContext({"cookies": [{"name": "CONSENT"}], "origins": []})
+    manager._save_storage_state()
+    assert manager._storage_state_is_fresh()
+
+    (manager.storage_state_dir / "cookies.json").write_bytes(b'[{"name": "CONS')
+
+    assert not manager._storage_state_is_fresh()
+
+
+@pytest.mark.parametrize(
+    "current, target, expected",
+    [
+        ("https://www.google.com/maps/", "https://www.google.com/maps", True),
+        ("https://www.google.com/maps#pane", "https://www.google.com/maps", True),
+        ("https://www.google.com/maps/place/A", "https://www.google.com/maps", False),
+        ("", "https://www.google.com/maps", False),
+    ],
+)
+def test_urls_match(current, target, expected):
+    assert GoogleMapsSessionManager._urls_match(current, target) is expected
+
+
+class FakeProxiedContext(FakeSyncContext):
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+        self.routes = []
+
+    def route(self, *args):
+        self.routes.append(args[0])
+
+    def unroute(self, *args):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSyncBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    def new_context(self, **kwargs):
+        context = FakeProxiedContext()
+        self.contexts.append(context)
+        return context
+
+
+def test_proxy_flow_reuses_context_per_proxy(tmp_path, proxies, monkeypatch):
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+    manager._browser = FakeSyncBrowser()
+    monkeypatch.setattr(manager.logger, "isEnabledFor", lambda level: False)
+
+    manager._get_page_with_proxy_simple("https://www.google.com/maps")
+    manager._get_page_with_proxy_simple("https://www.google.com/maps/place/A")
+
+    assert len(manager._browser.contexts) == 1
+    assert len(manager._browser.contexts[0].pages) == 2
+    # Each proxied goto is the target load itself; nothing may be aborted under it
+    assert manager._browser.contexts[0].routes == []
+
+    browser = manager._browser
+    manager.cleanup()
+    assert browser.contexts[0].closed
+    assert manager._proxy_contexts == {}
+
+
+def test_proxy_override_reuses_one_browser_across_proxies(tmp_path, proxies, monkeypatch):
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+    manager._browser = FakeSyncBrowser()
+    monkeypatch.setattr(manager.logger, "isEnabledFor", lambda level: False)
+
+    for proxy in proxies:
+        manager.get_authenticated_page("https://www.google.com/maps", proxy_override=proxy)
+
+    assert len(manager._browser.contexts) == len(proxies)
+    assert proxy_manager.probes == 0
+    assert proxy_manager.successes == [proxy["ip"] for proxy in proxies]
+
+
+def test_failed_proxy_override_raises_without_trying_another_proxy(tmp_path, proxies, monkeypatch):
+    class FailingPage(FakeSyncPage):
+        def goto(self, url, **kwargs):
+            raise TimeoutError("proxy unreachable")
+
+    class FailingContext(FakeProxiedContext):
+        def new_page(self):
+            page = FailingPage()
+            self.pages.append(page)
+            return page
+
+    class FailingBrowser(FakeSyncBrowser):
+        def new_context(self, **kwargs):
+            context = FailingContext()
+            self.contexts.append(context)
+            return context
+
+    proxy_manager = FakeProxyManager(proxies)
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), proxy_manager=proxy_manager)
+    manager._browser = FailingBrowser()
+
+    with pytest.raises(TimeoutError):
+        manager.get_authenticated_page("https://www.google.com/maps", proxy_override=proxies[1])
+
+    assert len(manager._browser.contexts) == 1
+    assert proxy_manager.probes == 0
+    assert proxy_manager.failures == [proxies[1]["ip"]]
+
+
+def test_get_authenticated_pages_fans_out_over_pool():
+    proxies = [{"ip": "10.0.0.1", "port": "8000"}, {"ip": "10.0.0.2", "port": "8000"}]
+    browser = FakeAsyncBrowser({"10.0.0.1": (0.01, False), "10.0.0.2": (0.01, False)})
+    manager = AsyncGoogleMapsSessionManager(proxy_manager=FakeProxyManager(proxies), pool_size=2)
+    manager._browser = browser
+    urls = [f"https://www.google.com/maps/place/{index}" for index in range(2)]
+
+    pages = asyncio.run(manager.get_authenticated_pages(urls))
+
+    assert [page.url for page in pages] == urls
+    assert set(browser.contexts) == {"10.0.0.1", "10.0.0.2"}
+
+
+def test_flush_storage_state_writes_only_when_dirty(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeContext({"cookies": [], "origins": []})
+
+    manager._flush_storage_state()
+    assert manager._context.calls == 0
+
+    manager._mark_storage_dirty()
+    manager._mark_storage_dirty()
+    assert manager._context.calls == 0
+
+    manager._flush_storage_state()
+    manager._flush_storage_state()
+    assert manager._context.calls == 1
+
+
+def test_auth_phase_router_uses_configured_blocklist(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), blocked_resource_types={"image"})
+    stylesheet = FakeRoute("https://www.gstatic.com/maps.css", "stylesheet")
+    tile = FakeRoute("https://www.google.com/maps/vt?pb=tile", "image")
+
+    manager._auth_phase_router(stylesheet)
+    manager._auth_phase_router(tile)
+
+    assert stylesheet.outcome == "fallback"
+    assert tile.outcome == "abort"
+    assert manager._aborted_requests == 1
+
+
+def test_auth_phase_router_keeps_stylesheets_by_default(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    stylesheet = FakeRoute("https://www.gstatic.com/maps.css", "stylesheet")
+
+    manager._auth_phase_router(stylesheet)
+
+    assert stylesheet.outcome == "fallback"
+    assert manager._aborted_requests == 0
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.google.com/recaptcha/api2/anchor?k=abc", True),
+        ("https://www.gstatic.com/recaptcha/releases/xyz/recaptcha__en.js", True),
+        ("https://www.google.com/maps/search/recaptcha", False),
+    ],
+)
+def test_recaptcha_url_pattern(url, expected):
+    assert bool(_RECAPTCHA_URL_RE.search(url)) is expected
+
+
+def test_auth_retry_clears_cookies_before_resetting_context(tmp_path, monkeypatch):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), max_auth_attempts=3)
+    context = FakeSyncContext()
+    context.cleared = 0
+    context.clear_cookies = lambda: setattr(context, "cleared", context.cleared + 1)
+    manager._context = context
+    outcomes = [RuntimeError("consent timeout"), RuntimeError("consent timeout"), FakeSyncPage()]
+    resets = []
+
+    def fake_setup_authentication():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(manager, "_start_browser", lambda: None)
+    monkeypatch.setattr(manager, "_is_authenticated", lambda probe_url: None)
+    monkeypatch.setattr(manager, "_setup_authentication", fake_setup_authentication)
+    monkeypatch.setattr(manager, "_reset_context", lambda: resets.append(True))
+
+    manager._get_page_with_session_management("https://www.google.com/maps")
+
+    assert context.cleared == 1
+    assert resets == [True]
+
+
+def test_storage_state_not_fresh_without_cookies(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeContext({"cookies": [], "origins": []})
+    manager._save_storage_state()
+
+    assert not manager._storage_state_is_fresh()
+
+
+@pytest.mark.parametrize(
+    "cookies, expected",
+    [
+        ([{"name": "NID", "expires": 4102444800}], False),
+        ([{"name": "CONSENT", "expires": 946684800}], False),
+        ([{"name": "SOCS", "expires": 4102444800}], True),
+        ([{"name": "CONSENT", "expires": -1}], True),
+    ],
+)
+def test_storage_state_fresh_only_with_unexpired_consent_cookie(tmp_path, cookies, expected):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeContext({"cookies": cookies, "origins": []})
+    manager._save_storage_state()
+
+    assert manager._storage_state_is_fresh() is expected
+
+
+def test_navigate_reuses_long_lived_page(tmp_path):
+    manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path))
+    manager._context = FakeSyncContext()
+    manager._page = FakeSyncPage()
+
+    first = manager.navigate("https://www.google.com/maps/place/A")
+    second = manager.navigate("https://www.google.com/maps/place/B")
+
+    assert first is second is manager._page
+    assert manager._context.pages == []
+    assert first.visits == ["https://www.google.com/maps/place/A", "https://www.google.com/maps/place/B"]
+
+
+def test_stop_persistent_browser_kills_recorded_process(tmp_path):
+    from google_maps_session_manager import stop_persistent_browser
+
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    (tmp_path / "browser.pid").write_text(str(process.pid))
+    (tmp_path / "ws.endpoint").write_text("ws://127.0.0.1:9222/devtools/browser/x")
+
+    assert stop_persistent_browser(tmp_path) is True
+    assert process.wait(timeout=5) != 0
+    assert not (tmp_path / "ws.endpoint").exists()
+    assert stop_persistent_browser(tmp_path) is False
+
+
+def test_priority_consent_button_prefers_accept_all():
+    from google_maps_session_manager import _priority_consent_button
+
+    class Button:
+        def __init__(self, name, visible):
+            self.name = name
+            self.visible = visible
+            self.first = self
+
+        def is_visible(self):
+            return self.visible
+
+    buttons = {
+        'button:has-text("Accept all")': Button("accept-all", True),
+        '[aria-label*="Accept"]': Button("aria", True),
+    }
+
+    class Page:
+        def locator(self, selector):
+            return buttons.get(selector, Button(selector, False))
+
+    assert _priority_consent_button(Page()).name == "accept-all"
+
+
+class ClosableSyncPage(FakeSyncPage):
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+class ClosablePagesContext(FakeProxiedContext):
+    def new_page(self):
+        page = ClosableSyncPage()
+        self.pages.append(page)
+        return page
+
+
+class ClosablePagesBrowser(FakeSyncBrowser):
+    def new_context(self, **kwargs):
+        context = ClosablePagesContext()
+        self.contexts.append(context)
+        return context
+
+
+def test_kept_scraper_session_leaves_one_live_context(tmp_path, monkeypatch):
+    from google_maps_brand_scraper import GoogleMapsBrandScraper
+
+    browser = ClosablePagesBrowser()
+    managers = []
+
+    def build_manager(**kwargs):
+        manager = GoogleMapsSessionManager(user_data_dir=str(tmp_path), headless=True)
+        manager._browser = browser
+        managers.append(manager)
+        return manager
+
+    monkeypatch.setattr("google_maps_brand_scraper.GoogleMapsSessionManager", build_manager)
+    monkeypatch.setattr(GoogleMapsBrandScraper, "_ensure_directory_view", lambda self, page: False)
+    monkeypatch.setattr(GoogleMapsBrandScraper, "_extract_brands_from_directory", lambda self, page: ["Brand"])
+
+    scraper = GoogleMapsBrandScraper(headless=True, keep_session=True)
+    assert scraper.scrape_brands("https://www.google.com/maps/place/A") == ["Brand"]
+    # A page closed between URLs forces a fresh authenticated page on the same context
+    managers[0]._page.close()
+    assert scraper.scrape_brands("https://www.google.com/maps/place/B") == ["Brand"]
+
+    assert len(managers) == 1
+    assert [context for context in browser.contexts if not context.closed] == browser.contexts[:1]
+    assert len(browser.contexts) == 1
+
+    scraper.cleanup()
+    assert browser.contexts[0].closed
@@ -165,3 +165,126 @@ def test_click_view_all_section_fallback(monkeypatch):
     assert _click_view_all_button(page)
     assert clicked == ["clicked"]
 
+
+
+def test_click_view_all_resolves_selectors_once_and_skips_hidden_checks():
+    from google_maps_brand_scraper import _click_view_all_button
+
+    hidden = FakeLocator(visible=False, enabled=AssertionError("is_enabled on hidden locator"))
+    page = FakePage({'ROLE::button::View all': hidden})
+    lookups = []
+    original = page.get_by_role
+
+    def counting_get_by_role(role, name):
+        lookups.append((role, name))
+        return original(role, name)
+
+    page.get_by_role = counting_get_by_role
+
+    assert _click_view_all_button(page, max_attempts=3) is False
+    assert lookups == [("button", "View all")]
+    assert hidden.scroll_calls == 0
+
+
+class UnionLocator(FakeLocator):
+    def __init__(self, *members, **kwargs):
+        super().__init__(**kwargs)
+        self.members = list(members) or [self]
+        self.count_calls = 0
+
+    def or_(self, other):
+        return UnionLocator(*self.members, other)
+
+    def count(self):
+        self.count_calls += 1
+        return sum(1 for member in self.members if member.visible)
+
+
+def test_click_view_all_skips_probing_while_nothing_matches():
+    from google_maps_brand_scraper import _click_view_all_button
+
+    probes = []
+
+    class AbsentLocator(UnionLocator):
+        def is_visible(self, timeout=0):
+            probes.append(timeout)
+            return False
+
+    page = FakePage(
+        {
+            'ROLE::button::View all': AbsentLocator(visible=False),
+            '[aria-label="View all"]': AbsentLocator(visible=False),
+        }
+    )
+
+    assert _click_view_all_button(page, max_attempts=3) is False
+    assert probes == []
+    assert page.clicks == ["sleep:500"] * 3
+
+
+def test_click_view_all_union_keeps_selector_priority():
+    from google_maps_brand_scraper import _click_view_all_button
+
+    clicked = []
+    page = FakePage(
+        {
+            'ROLE::button::View all': UnionLocator(to_click=lambda: clicked.append("role")),
+            '[aria-label="View all"]': UnionLocator(to_click=lambda: clicked.append("aria")),
+        }
+    )
+
+    assert _click_view_all_button(page)
+    assert clicked == ["role"]
+
+
+def test_click_view_all_waits_for_directory_instead_of_sleeping(monkeypatch):
+    from google_maps_brand_scraper import DIRECTORY_READY_SELECTOR, _click_view_all_button
+
+    class WaitingPage(FakePage):
+        def wait_for_selector(self, selector, **kwargs):
+            self.clicks.append(f"wait:{selector}")
+
+    page = WaitingPage({'ROLE::button::View all': FakeLocator(to_click=lambda: None)})
+
+    assert _click_view_all_button(page)
+    assert page.clicks == [f"wait:{DIRECTORY_READY_SELECTOR}"]
+
+
+def test_directory_wait_timeout_does_not_add_a_grace_sleep():
+    from google_maps_brand_scraper import PlaywrightTimeoutError, _wait_for_directory
+
+    class TimingOutPage(FakePage):
+        def wait_for_selector(self, selector, **kwargs):
+            self.clicks.append("wait")
+            raise PlaywrightTimeoutError("timed out")
+
+    page = TimingOutPage({})
+
+    assert _wait_for_directory(page, timeout_ms=100) is False
+    assert page.clicks == ["wait"]
+
+
+def test_activate_directory_tab_uses_one_fused_locator():
+    from google_maps_brand_scraper import DIRECTORY_TAB_SELECTORS, activate_directory_tab
+
+    calls = []
+
+    class TabLocator:
+        first = property(lambda self: self)
+
+        def wait_for(self, **kwargs):
+            calls.append("wait")
+
+        def is_enabled(self):
+            return True
+
+        def scroll_into_view_if_needed(self, **kwargs):
+            pass
+
+        def click(self):
+            calls.append("click")
+
+    page = FakePage({", ".join(DIRECTORY_TAB_SELECTORS): TabLocator()})
+
+    assert activate_directory_tab(page)
+    assert calls == ["wait", "click"]